@@ -0,0 +1,102 @@
+"""
+Çok İş Parçacıklı Performans Ölçümü
+===================================
+Bu modül, CollatzRSUPool'un iş parçacığı sayısıyla nasıl ölçeklendiğini
+ölçer. Aynı betik hem GIL'li hem de GIL'siz (free-threaded, ör. python3.14t)
+yorumlayıcılarda çalıştırılarak sonuçlar karşılaştırılabilir.
+
+Kullanım:
+    python benchmark.py [toplam_MB] [iş_parçacığı_sayıları...]
+    python3.14t benchmark.py 4 1 2 4 8
+
+Yazar: [İsminizi Yazın]
+Tarih: Ocak 2026
+"""
+
+import sys
+import time
+import threading
+from typing import List, Dict
+from collatz_rsu import CollatzRSUPool, LFSRKeystreamTable
+
+
+def gil_status() -> str:
+    """Yorumlayıcının GIL durumunu döndürür."""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_enabled is None:
+        return "GIL açık (free-threaded destek yok)"
+    return "GIL açık" if is_enabled() else "GIL kapalı (free-threaded)"
+
+
+def run_threads(seed: int, threads: int, total_bytes: int,
+                chunk: int = 1 << 14) -> Dict:
+    """
+    Toplam total_bytes'ı threads iş parçacığına bölerek üretir.
+
+    Args:
+        seed: Ana tohum
+        threads: İş parçacığı sayısı
+        total_bytes: Toplam üretilecek byte
+        chunk: Tek read çağrısının boyutu
+
+    Returns:
+        Ölçüm sonuçları sözlüğü
+    """
+    pool = CollatzRSUPool(seed, lfsr_table=LFSRKeystreamTable.shared())
+    share = total_bytes // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        buffer = bytearray(chunk)
+        rsu = pool.get()
+        barrier.wait()
+        for _ in range(share // chunk):
+            rsu.readinto(buffer)
+        if share % chunk:
+            rsu.read(share % chunk)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    produced = share * threads
+    return {
+        'threads': threads,
+        'bytes': produced,
+        'seconds': elapsed,
+        'mb_per_s': produced / elapsed / (1 << 20) if elapsed > 0 else 0
+    }
+
+
+def main(argv: List[str]):
+    """Ana ölçüm fonksiyonu."""
+    total_mb = float(argv[0]) if argv else 2.0
+    thread_counts = [int(arg) for arg in argv[1:]] or [1, 2, 4, 8]
+    total_bytes = int(total_mb * (1 << 20))
+
+    print("\n⏱️  Collatz-Fibonacci-Chaos RSÜ İş Parçacığı Ölçümü")
+    print("=" * 70)
+    print(f"Python  : {sys.version.split()[0]}")
+    print(f"Durum   : {gil_status()}")
+    print(f"Veri    : {total_mb:g} MB")
+    print("-" * 70)
+    print(f"{'İş parçacığı':>14} {'Süre (s)':>12} {'MB/s':>10} {'Hızlanma':>10}")
+
+    baseline = None
+    for threads in thread_counts:
+        result = run_threads(12345, threads, total_bytes)
+        if baseline is None:
+            baseline = result['mb_per_s']
+        speedup = result['mb_per_s'] / baseline if baseline else 0
+        print(f"{threads:>14} {result['seconds']:>12.3f} "
+              f"{result['mb_per_s']:>10.3f} {speedup:>9.2f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
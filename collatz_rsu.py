@@ -12,8 +12,139 @@ Yazar: [İsminizi Yazın]
 Tarih: Ocak 2026
 """
 
+import argparse
+import binascii
+import hashlib
+import mmap
+import os
+import multiprocessing
 import struct
-from typing import List, Tuple, Generator
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Generator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy isteğe bağlıdır (yalnızca toplu/dizi API'leri için)
+    np = None
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.8 öncesi (yalnızca SharedKeystreamBuffer için)
+    shared_memory = None
+
+
+# ==================== PAKETLİ BİT YARDIMCILARI ====================
+#
+# Paketli gösterimde bit dizisi LSB-first byte'lara yerleştirilir:
+# i. bit, data[i >> 3] byte'ının (i & 7). bitidir. Bu düzen
+# generate_bytes ve text_to_bits ile aynıdır.
+
+_BIT_CHARS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack_bits(bits: List[int]) -> bytes:
+    """
+    Bit listesini paketli byte dizisine dönüştürür.
+    
+    Args:
+        bits: 0/1 bit listesi
+        
+    Returns:
+        LSB-first paketlenmiş byte dizisi
+    """
+    if not bits:
+        return b''
+    value = int(''.join('1' if bit else '0' for bit in reversed(bits)), 2)
+    return value.to_bytes((len(bits) + 7) // 8, 'little')
+
+
+def unpack_bits(data: bytes, count: int) -> List[int]:
+    """
+    Paketli byte dizisinden ilk count biti liste olarak açar.
+    
+    Args:
+        data: LSB-first paketlenmiş byte dizisi
+        count: Açılacak bit sayısı
+        
+    Returns:
+        Bit listesi
+    """
+    if count <= 0:
+        return []
+    value = int.from_bytes(data, 'little') & ((1 << count) - 1)
+    digits = format(value, '0{}b'.format(count))
+    return list(digits[::-1].encode('ascii').translate(_BIT_CHARS))
+
+
+def xor_packed(a: bytes, b: bytes) -> bytes:
+    """İki paketli diziyi tek bir büyük tamsayı işlemiyle XOR'lar."""
+    length = min(len(a), len(b))
+    value = int.from_bytes(a[:length], 'little') ^ int.from_bytes(b[:length], 'little')
+    return value.to_bytes(length, 'little')
+
+
+class _BitWriter:
+    """Değişken uzunluklu bit gruplarını paketli bir tampona biriktirir."""
+    
+    __slots__ = ('buffer', 'acc', 'nbits')
+    
+    def __init__(self):
+        self.buffer = bytearray()
+        self.acc = 0     # Henüz tampona yazılmamış bitler
+        self.nbits = 0   # acc içindeki bit sayısı
+    
+    def write(self, value: int, count: int):
+        """value'nun düşük count bitini ekler (value daha geniş olmamalı)."""
+        self.acc |= value << self.nbits
+        self.nbits += count
+        if self.nbits >= 64:
+            whole = self.nbits >> 3
+            self.buffer += (self.acc & ((1 << (whole << 3)) - 1)).to_bytes(whole, 'little')
+            self.acc >>= whole << 3
+            self.nbits &= 7
+    
+    def __len__(self) -> int:
+        return (len(self.buffer) << 3) + self.nbits
+    
+    def getvalue(self) -> Tuple[bytes, int]:
+        """(paketli_bitler, bit_sayısı) döndürür."""
+        tail = self.acc.to_bytes((self.nbits + 7) // 8, 'little')
+        return bytes(self.buffer) + tail, len(self)
+
+
+class _BitRing:
+    """Yalnızca son capacity biti tutan sınırlı halka tampon."""
+    
+    __slots__ = ('capacity', 'value', 'count')
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.value = 0   # En eski bit en düşük konumda
+        self.count = 0
+    
+    def append(self, data: bytes, count: int):
+        """Paketli count biti ekler, taşan en eski bitleri atar."""
+        if count >= self.capacity:
+            skip = count - self.capacity
+            value = int.from_bytes(data[skip >> 3:], 'little') >> (skip & 7)
+            self.value = value & ((1 << self.capacity) - 1)
+            self.count = self.capacity
+            return
+        value = int.from_bytes(data, 'little') & ((1 << count) - 1)
+        self.value |= value << self.count
+        self.count += count
+        if self.count > self.capacity:
+            self.value >>= self.count - self.capacity
+            self.count = self.capacity
+    
+    def bits(self) -> List[int]:
+        """Tutulan bitleri eskiden yeniye liste olarak döndürür."""
+        return unpack_bits(self.value.to_bytes((self.count + 7) // 8, 'little'), self.count)
 
 
 class CollatzGenerator:
@@ -67,10 +198,94 @@ class CollatzGenerator:
         
         return self.sequence
     
+    def generate_packed(self, max_steps: int = 1000) -> Tuple[bytes, int]:
+        """
+        Parite bitlerini diziyi saklamadan, paketli olarak üretir.
+        
+        Args:
+            max_steps: Maksimum adım sayısı
+            
+        Returns:
+            (paketli_bitler, bit_sayısı) tuple'ı; bitler generate_sequence
+            ile üretilen self.bits ile aynıdır
+        """
+        data, count, _, _ = CollatzParityEngine.default().run(self.seed, max_steps)
+        return data, count
+    
+    def iter_bits(self, max_steps: int = 1000) -> Generator[int, None, None]:
+        """
+        Parite bitlerini tek tek, diziyi saklamadan üretir (O(1) bellek).
+        
+        Args:
+            max_steps: Maksimum adım sayısı
+            
+        Yields:
+            self.bits ile aynı sırada 0/1 bitleri
+        """
+        n = self.seed
+        yield n & 1
+        step = 0
+        while n != 1 and step < max_steps:
+            n = n >> 1 if n % 2 == 0 else 3 * n + 1
+            yield n & 1
+            step += 1
+    
+    def iter_packed(self, max_steps: int = 1000,
+                    chunk_bits: int = 1 << 15) -> Generator[Tuple[bytes, int], None, None]:
+        """
+        Parite bitlerini paketli parçalar halinde üretir.
+        
+        Args:
+            max_steps: Maksimum adım sayısı
+            chunk_bits: Yaklaşık parça boyutu (bit)
+            
+        Yields:
+            (paketli_bitler, bit_sayısı) tuple'ları; son parça dışındakiler
+            byte hizalıdır
+        """
+        engine = CollatzParityEngine.default()
+        yield from engine.iter_packed(self.seed, max_steps, chunk_bits)
+    
+    def summary(self, max_steps: int = 1000) -> dict:
+        """
+        Diziyi saklamadan özet istatistikleri hesaplar (O(1) bellek).
+        
+        Args:
+            max_steps: Maksimum adım sayısı
+            
+        Returns:
+            Adım sayısı, en büyük değer ve parite sayılarını içeren sözlük
+        """
+        n = self.seed
+        max_value = n
+        ones = n & 1
+        step = 0
+        while n != 1 and step < max_steps:
+            if n & 1:
+                n = 3 * n + 1
+                step += 1
+                if n > max_value:
+                    max_value = n
+            else:
+                # Çift koşusunu tek kaydırmada soy
+                zeros = min((n & -n).bit_length() - 1, max_steps - step)
+                n >>= zeros
+                step += zeros
+                ones += n & 1
+        
+        return {
+            'steps': step,
+            'max_value': max_value,
+            'ones': ones,
+            'zeros': step + 1 - ones,
+            'final_value': n,
+            'reached_one': n == 1
+        }
+    
     def get_bits(self) -> List[int]:
         """Üretilen bit dizisini döndürür."""
         if not self.bits:
-            self.generate_sequence()
+            self.bits = unpack_bits(*self.generate_packed())
         return self.bits
     
     def get_seed_from_bits(self, bits: List[int]) -> int:
@@ -85,6 +300,211 @@ class CollatzGenerator:
             seed |= (bit << i)
         
         return seed if seed != 0 else 1  # Sıfır olmamalı
+    
+    # LFSR tohumu önbellekleri (0 = henüz hesaplanmadı; gerçek değer
+    # hiçbir zaman 0 olmaz). _PREFIX_SMALL tohumun kendisiyle,
+    # _PREFIX_LARGE ise 2^16 ve üzeri tohumlar için tohum mod 2^16 ile
+    # indekslenir.
+    _PREFIX_SMALL = array('H', [0]) * (1 << 16)
+    _PREFIX_LARGE = array('H', [0]) * (1 << 16)
+    
+    @staticmethod
+    def _prefix_seed(n: int) -> int:
+        """generate_sequence + get_seed_from_bits ile aynı 16-bit tohumu hesaplar."""
+        seed = 0
+        for i in range(16):
+            seed |= (n & 1) << i
+            if n == 1:
+                break
+            n = n // 2 if n % 2 == 0 else 3 * n + 1
+        return seed if seed != 0 else 1
+    
+    @classmethod
+    def lfsr_seed_for(cls, seed: int) -> int:
+        """
+        Diziyi üretmeden LFSR tohumunu döndürür.
+        
+        İlk 16 parite biti yalnızca tohumun 2^16 modundaki değerine
+        bağlıdır: k adımda en fazla k bölme olur ve x_k'nın paritesi
+        tohum mod 2^(k+1) ile belirlenir. 2^16 ve üzeri tohumlar 15 adımda
+        1'e ulaşamayacağından erken durma da olmaz. Daha küçük tohumlar
+        kendi değerleriyle ayrı bir tabloda tutulur.
+        
+        Args:
+            seed: Başlangıç sayısı (pozitif tam sayı)
+            
+        Returns:
+            get_seed_from_bits(get_bits()) ile aynı 16-bit değer
+        """
+        if seed <= 0:
+            raise ValueError("Seed pozitif bir tam sayı olmalıdır")
+        if seed < (1 << 16):
+            table, index, representative = cls._PREFIX_SMALL, seed, seed
+        else:
+            index = seed & 0xFFFF
+            table, representative = cls._PREFIX_LARGE, index + (1 << 16)
+        value = table[index]
+        if not value:
+            value = cls._prefix_seed(representative)
+            table[index] = value
+        return value
+    
+    @classmethod
+    def precompute_prefix_table(cls):
+        """Tohum tablolarını önceden tamamen doldurur (ör. sunucu açılışında)."""
+        for index in range(1, 1 << 16):
+            cls._PREFIX_SMALL[index] = cls._prefix_seed(index)
+        for index in range(1 << 16):
+            cls._PREFIX_LARGE[index] = cls._prefix_seed(index + (1 << 16))
+
+
+class CollatzParityEngine:
+    """
+    Toplu Collatz parite motoru.
+    
+    Kısayol dönüşümü T(n) = n/2 (çift) veya (3n+1)/2 (tek) için
+    n = 2^k * a + b yazılırsa, ilk k adımın pariteleri yalnızca b'ye
+    bağlıdır ve T^k(n) = 3^c * a + T^k(b) olur (c: tek adım sayısı).
+    Motor 2^k elemanlı tablolarla k kısayol adımını tek seferde atlar.
+    
+    CollatzGenerator'ın bit dizisinde her tek değeri, atlanan 3n+1
+    değerinin 0 biti izler; tablodaki desenler bu açılımı içerir.
+    Uzun çift koşuları (büyük tohumlar) sondaki sıfır sayısıyla tek
+    kaydırmada soyulur.
+    """
+    
+    DEFAULT_K = 12
+    
+    _instances: dict = {}
+    
+    def __init__(self, k: int = DEFAULT_K):
+        """
+        Args:
+            k: Blok başına kısayol adımı (tablo boyutu 2^k)
+        """
+        if k <= 0:
+            raise ValueError("k pozitif olmalıdır")
+        self.k = k
+        self.mask = (1 << k) - 1
+        size = 1 << k
+        self.patterns = [0] * size   # Açılmış parite deseni
+        self.lengths = [0] * size    # Desen uzunluğu = normal adım sayısı
+        self.multipliers = [0] * size  # 3^c
+        self.offsets = [0] * size    # T^k(b)
+        for b in range(size):
+            n = b
+            pattern = 0
+            length = 0
+            odd = 0
+            for _ in range(k):
+                if n & 1:
+                    pattern |= 1 << length   # Tek değer, ardından 3n+1 (0)
+                    length += 2
+                    odd += 1
+                    n = (3 * n + 1) >> 1
+                else:
+                    length += 1
+                    n >>= 1
+            self.patterns[b] = pattern
+            self.lengths[b] = length
+            self.multipliers[b] = 3 ** odd
+            self.offsets[b] = n
+    
+    @classmethod
+    def default(cls, k: int = DEFAULT_K) -> 'CollatzParityEngine':
+        """Verilen k için süreç genelinde paylaşılan motoru döndürür."""
+        engine = cls._instances.get(k)
+        if engine is None:
+            engine = cls._instances[k] = cls(k)
+        return engine
+    
+    def iter_packed(self, seed: int, max_steps: int = 1000,
+                    chunk_bits: int = 1 << 15) -> Generator[Tuple[bytes, int], None, Tuple[int, int]]:
+        """
+        Tohumun parite bitlerini paketli parçalar halinde üretir.
+        
+        Son parça dışındaki tüm parçalar byte hizalıdır, bu yüzden
+        parçaların art arda eklenmesi tüm akışı verir. Bellekte yalnızca
+        mevcut değer ve bir parça tutulur.
+        
+        Args:
+            seed: Başlangıç sayısı (pozitif tam sayı)
+            max_steps: Maksimum adım sayısı
+            chunk_bits: Yaklaşık parça boyutu (bit)
+            
+        Yields:
+            (paketli_bitler, bit_sayısı) tuple'ları
+            
+        Returns:
+            (son_değer, adım_sayısı) (StopIteration.value olarak)
+        """
+        if seed <= 0:
+            raise ValueError("Seed pozitif bir tam sayı olmalıdır")
+        k = self.k
+        mask = self.mask
+        patterns, lengths = self.patterns, self.lengths
+        multipliers, offsets = self.multipliers, self.offsets
+        block_floor = 1 << (k + 1)
+        chunk_bytes = max(1, chunk_bits >> 3)
+        
+        writer = _BitWriter()
+        write = writer.write
+        n = seed
+        steps = 0
+        while n != 1 and steps < max_steps:
+            budget = max_steps - steps
+            if not n & 1:
+                zeros = (n & -n).bit_length() - 1
+                if zeros >= k or n < block_floor or budget < 2 * k:
+                    # Çift koşusunu tek kaydırmada soy
+                    zeros = min(zeros, budget)
+                    write(0, zeros)
+                    n >>= zeros
+                    steps += zeros
+                    continue
+            if n >= block_floor and budget >= 2 * k:
+                # n >= 2^(k+1) iken blok içinde 1'e ulaşılamaz
+                b = n & mask
+                write(patterns[b], lengths[b])
+                steps += lengths[b]
+                n = multipliers[b] * (n >> k) + offsets[b]
+            elif n & 1:
+                write(1, 1)
+                n = 3 * n + 1
+                steps += 1
+            
+            if len(writer.buffer) >= chunk_bytes:
+                chunk = bytes(writer.buffer)
+                writer.buffer.clear()
+                yield chunk, len(chunk) << 3
+        
+        write(n & 1, 1)  # Son değerin paritesi
+        yield writer.getvalue()
+        return n, steps
+    
+    def run(self, seed: int, max_steps: int = 1000) -> Tuple[bytes, int, int, int]:
+        """
+        Tohumun parite bitlerini üretir.
+        
+        Args:
+            seed: Başlangıç sayısı (pozitif tam sayı)
+            max_steps: Maksimum adım sayısı
+            
+        Returns:
+            (paketli_bitler, bit_sayısı, son_değer, adım_sayısı) tuple'ı
+        """
+        chunks = []
+        count = 0
+        stream = self.iter_packed(seed, max_steps)
+        while True:
+            try:
+                data, bits = next(stream)
+            except StopIteration as stop:
+                n, steps = stop.value
+                break
+            chunks.append(data)
+            count += bits
+        return b''.join(chunks), count, n, steps
 
 
 class FibonacciLFSR:
@@ -100,15 +520,27 @@ class FibonacciLFSR:
     # Tap pozisyonları (0-indexed)
     TAPS = [15, 13, 12, 10]
     
-    def __init__(self, seed: int):
+    # Blok geçiş tabloları: adım sayısı -> (low, high)
+    _BLOCK_TABLES: dict = {}
+    
+    # Geçiş matrisinin 2^k kuvvetleri (sütun listeleri olarak)
+    _POWERS: List[List[int]] = []
+    _POWERS_LOCK = threading.Lock()
+    
+    def __init__(self, seed: int, table: Optional['LFSRKeystreamTable'] = None):
         """
         Args:
             seed: 16-bit başlangıç değeri (1-65535 arası)
+            table: Paylaşılan tam periyot tablosu (verilirse
+                generate_packed döngü yerine tablodan dilimler)
         """
         # Seed'i 16-bit'e sınırla
         self.state = seed & 0xFFFF
         if self.state == 0:
             self.state = 1  # Sıfır durumu yasak
+        self.initial_state = self.state
+        self.position = 0  # Başlangıçtan beri üretilen bit sayısı
+        self.table = table
     
     def step(self) -> int:
         """
@@ -125,9 +557,189 @@ class FibonacciLFSR:
         # Kaydırma yap ve yeni biti ekle
         output_bit = self.state & 1
         self.state = (self.state >> 1) | (feedback << 15)
+        self.position += 1
         
         return output_bit
     
+    @classmethod
+    def _advance(cls, state: int, steps: int) -> int:
+        """Durumu step() ile aynı kuralla steps adım ilerletir (çıktısız)."""
+        for _ in range(steps):
+            feedback = 0
+            for tap in cls.TAPS:
+                feedback ^= (state >> tap) & 1
+            state = (state >> 1) | (feedback << 15)
+        return state
+    
+    @classmethod
+    def _block_tables(cls, steps: int) -> Tuple[List[int], List[int]]:
+        """
+        steps adımlık geçiş tablolarını döndürür (ilk kullanımda üretilir).
+        
+        Geçiş GF(2) üzerinde doğrusal olduğundan yeni durum, düşük ve
+        yüksek byte'ın görüntülerinin XOR'udur:
+        advance(s) = low[s & 0xFF] ^ high[s >> 8]
+        
+        Args:
+            steps: Blok başına adım sayısı (8 veya 16)
+            
+        Returns:
+            (low, high) 256 elemanlı tablolar
+        """
+        tables = cls._BLOCK_TABLES.get(steps)
+        if tables is None:
+            basis = [cls._advance(1 << i, steps) for i in range(16)]
+            low = [0] * 256
+            high = [0] * 256
+            for value in range(1, 256):
+                lowest = value & -value
+                i = lowest.bit_length() - 1
+                low[value] = low[value ^ lowest] ^ basis[i]
+                high[value] = high[value ^ lowest] ^ basis[i + 8]
+            tables = (low, high)
+            cls._BLOCK_TABLES[steps] = tables
+        return tables
+    
+    def step_byte(self) -> int:
+        """
+        8 adım birden ilerler.
+        
+        Çıkış biti her adımda state'in 0. biti olduğundan, sonraki 8 çıkış
+        biti state'in düşük byte'ıdır.
+        
+        Returns:
+            LSB-first paketlenmiş 8 bit
+        """
+        low, high = self._block_tables(8)
+        output = self.state & 0xFF
+        self.state = low[output] ^ high[self.state >> 8]
+        self.position += 8
+        return output
+    
+    def step_word(self) -> int:
+        """
+        16 adım birden ilerler.
+        
+        Returns:
+            LSB-first paketlenmiş 16 bit (mevcut state'in kendisi)
+        """
+        low, high = self._block_tables(16)
+        output = self.state
+        self.state = low[output & 0xFF] ^ high[output >> 8]
+        self.position += 16
+        return output
+    
+    def generate_packed(self, count: int) -> bytes:
+        """
+        Belirtilen sayıda biti paketli olarak üretir.
+        
+        Bitler 16'lık bloklar halinde tablo ile üretilir; step() ile
+        bit bit aynı diziyi verir. Tam periyot tablosu bağlıysa çıktı
+        tablodan kopyasız bir dilim olabilir.
+        
+        Args:
+            count: Üretilecek bit sayısı
+            
+        Returns:
+            LSB-first paketlenmiş byte dizisi (bytes veya memoryview)
+        """
+        if self.table is not None:
+            data = self.table.read(self, count)
+            if data is not None:
+                return data
+        return self._generate_words(count)
+    
+    def _generate_words(self, count: int) -> bytes:
+        """generate_packed'in 16 bitlik tablo yolu."""
+        words, rest = divmod(count, 16)
+        low, high = self._block_tables(16)
+        state = self.state
+        outputs = []
+        append = outputs.append
+        for _ in range(words):
+            append(state)
+            state = low[state & 0xFF] ^ high[state >> 8]
+        self.state = state
+        
+        data = struct.pack('<{}H'.format(words), *outputs)
+        if rest:
+            tail = state & ((1 << rest) - 1)
+            self.state = self._advance(state, rest)
+            data += tail.to_bytes((rest + 7) // 8, 'little')
+        self.position += count
+        return data
+    
+    @staticmethod
+    def _apply(columns: List[int], state: int) -> int:
+        """Sütunlarıyla verilen GF(2) matrisini duruma uygular."""
+        result = 0
+        i = 0
+        while state:
+            if state & 1:
+                result ^= columns[i]
+            state >>= 1
+            i += 1
+        return result
+    
+    @classmethod
+    def _power(cls, k: int) -> List[int]:
+        """
+        Geçiş matrisinin 2^k. kuvvetini döndürür.
+        
+        Kuvvetler ilk ihtiyaçta karesi alınarak üretilir ve sınıf
+        düzeyinde saklanır, böylece tüm örnekler paylaşır.
+        """
+        powers = cls._POWERS
+        if len(powers) > k:
+            return powers[k]
+        # Listeye ekleme sırası indeksleri belirler; eşzamanlı iş
+        # parçacıkları aynı kuvveti iki kez eklememeli
+        with cls._POWERS_LOCK:
+            if not powers:
+                powers.append([cls._advance(1 << i, 1) for i in range(16)])
+            while len(powers) <= k:
+                last = powers[-1]
+                powers.append([cls._apply(last, column) for column in last])
+        return powers[k]
+    
+    def jump(self, n: int):
+        """
+        Bit üretmeden n adım ileri atlar.
+        
+        Register doğrusal olduğundan n adım, geçiş matrisinin 2'nin
+        kuvvetleriyle O(log n) matris uygulamasına indirgenir.
+        
+        Args:
+            n: Atlanacak adım sayısı (negatif olamaz)
+        """
+        if n < 0:
+            raise ValueError("Atlama miktarı negatif olamaz")
+        self.position += n
+        state = self.state
+        k = 0
+        while n:
+            if n & 1:
+                state = self._apply(self._power(k), state)
+            n >>= 1
+            k += 1
+        self.state = state
+    
+    def seek(self, position: int):
+        """
+        Akışta verilen bit konumuna gider.
+        
+        Geçiş matrisi tersinir olmadığından (tap'lar sadece üst 6 biti
+        okur) konum her zaman başlangıç durumundan hesaplanır.
+        
+        Args:
+            position: Başlangıçtan itibaren bit konumu
+        """
+        if position < 0:
+            raise ValueError("Konum negatif olamaz")
+        self.state = self.initial_state
+        self.position = 0
+        self.jump(position)
+    
     def generate_bits(self, count: int) -> List[int]:
         """
         Belirtilen sayıda bit üretir.
@@ -138,13 +750,232 @@ class FibonacciLFSR:
         Returns:
             Bit listesi
         """
-        return [self.step() for _ in range(count)]
+        return unpack_bits(self.generate_packed(count), count)
     
     def get_state(self) -> int:
         """Mevcut durumu döndürür."""
         return self.state
 
 
+class LFSRKeystreamTable:
+    """
+    FibonacciLFSR için tam periyot anahtar akışı tablosu.
+    
+    16-bit register en fazla 65536 duruma sahiptir. Tablo her döngüyü
+    (ring) bir kez dolaşır, çıkış bitlerini paketler ve her durum için
+    (ring, ofset) indeksini tutar. Böylece generate_packed bit döngüsü
+    yerine bir dilim kopyasına dönüşür.
+    
+    Tek periyotlu bir ring her bit ofsetinden byte hizalı okunabilsin
+    diye 8 kez açılmış halde (P bit * 8 = P byte) saklanır.
+    
+    Not: TAPS = [15, 13, 12, 10] yalnızca üst 6 biti okuduğundan
+    register gerçekte 63 periyotlu bir döngüye ve sıfır durumuna düşer;
+    döngü dışındaki durumlar (en fazla birkaç adım) normal ilerletilir.
+    """
+    
+    MAGIC = b'LKST'
+    VERSION = 1
+    
+    # Dosya başlığı: magic, sürüm, bayt sırası, ring sayısı
+    _HEADER = struct.Struct('<4sHBxI')
+    
+    _shared: Optional['LFSRKeystreamTable'] = None
+    
+    def __init__(self, index, rings: List[Tuple[int, memoryview, memoryview, memoryview]],
+                 backing=None):
+        """
+        Args:
+            index: 65536 elemanlı durum -> (ring << 16 | ofset) dizisi
+                (döngü dışındaki durumlar için -1)
+            rings: (periyot, açılmış_bitler, byte_indeksi, durumlar) listesi
+            backing: Tablonun dayandığı nesne (ör. mmap), açık tutulur
+        """
+        self.index = index
+        self.rings = rings
+        self._ring_bytes = [bytes(ring[1]) for ring in rings]
+        self._backing = backing
+    
+    @classmethod
+    def build(cls) -> 'LFSRKeystreamTable':
+        """
+        Tüm durumları dolaşarak tabloyu üretir.
+        
+        Returns:
+            LFSRKeystreamTable instance
+        """
+        low, high = FibonacciLFSR._block_tables(1)
+        successor = [low[s & 0xFF] ^ high[s >> 8] for s in range(1 << 16)]
+        
+        index = array('i', [-1]) * (1 << 16)
+        visited = [0] * (1 << 16)
+        rings = []
+        for start in range(1 << 16):
+            if visited[start]:
+                continue
+            # Ziyaret edilmiş bir duruma ulaşana kadar ilerle
+            state = start
+            while not visited[state]:
+                visited[state] = start + 1
+                state = successor[state]
+            if visited[state] != start + 1:
+                continue
+            
+            # Bu yolda yeni bir döngü bulundu
+            states = array('H')
+            cursor = state
+            while True:
+                index[cursor] = (len(rings) << 16) | len(states)
+                states.append(cursor)
+                cursor = successor[cursor]
+                if cursor == state:
+                    break
+            rings.append(cls._make_ring(states))
+        return cls(index, rings)
+    
+    @staticmethod
+    def _make_ring(states: array) -> Tuple[int, memoryview, memoryview, memoryview]:
+        """Bir döngünün açılmış bitlerini ve byte indeksini hazırlar."""
+        period = len(states)
+        digits = ''.join('1' if state & 1 else '0' for state in states) * 8
+        value = int(digits[::-1], 2)
+        data = value.to_bytes(period, 'little')
+        
+        # Her ofset için 8'in katı olan eşdeğer başlangıç (P tek ise vardır)
+        byte_index = array('H', [0xFFFF]) * period
+        for offset in range(period):
+            for copy in range(8):
+                start = offset + copy * period
+                if start % 8 == 0:
+                    byte_index[offset] = start // 8
+                    break
+        return period, memoryview(data), memoryview(byte_index), memoryview(states)
+    
+    @classmethod
+    def shared(cls) -> 'LFSRKeystreamTable':
+        """Süreç başına bir kez üretilen ortak tabloyu döndürür."""
+        if cls._shared is None:
+            cls._shared = cls.build()
+        return cls._shared
+    
+    def save(self, path: str):
+        """
+        Tabloyu mmap ile yüklenebilecek ikili dosyaya yazar.
+        
+        Args:
+            path: Hedef dosya yolu
+        """
+        byteorder = 0 if struct.pack('=H', 1) == b'\x01\x00' else 1
+        with open(path, 'wb') as f:
+            f.write(self._HEADER.pack(self.MAGIC, self.VERSION, byteorder, len(self.rings)))
+            f.write(struct.pack('<{}I'.format(len(self.rings)),
+                                *[ring[0] for ring in self.rings]))
+            f.write(self.index.tobytes() if isinstance(self.index, array)
+                    else bytes(self.index.cast('B')))
+            for period, data, byte_index, states in self.rings:
+                f.write(data)
+                f.write(b'\x00' * (-period % 4))
+                f.write(byte_index.cast('B'))
+                f.write(states.cast('B'))
+                f.write(b'\x00' * (-(4 * period) % 4))
+    
+    @classmethod
+    def load(cls, path: str) -> 'LFSRKeystreamTable':
+        """
+        save() ile yazılmış tabloyu kopyalamadan (mmap) yükler.
+        
+        Args:
+            path: Tablo dosyası
+            
+        Returns:
+            LFSRKeystreamTable instance
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, version, byteorder, ring_count = cls._HEADER.unpack_from(view)
+        native = 0 if struct.pack('=H', 1) == b'\x01\x00' else 1
+        if magic != cls.MAGIC or version != cls.VERSION or byteorder != native:
+            raise ValueError("Geçersiz veya uyumsuz LFSR tablo dosyası")
+        
+        offset = cls._HEADER.size
+        periods = struct.unpack_from('<{}I'.format(ring_count), view, offset)
+        offset += 4 * ring_count
+        index = view[offset:offset + 4 * (1 << 16)].cast('i')
+        offset += 4 * (1 << 16)
+        
+        rings = []
+        for period in periods:
+            data = view[offset:offset + period]
+            offset += period + (-period % 4)
+            byte_index = view[offset:offset + 2 * period].cast('H')
+            offset += 2 * period
+            states = view[offset:offset + 2 * period].cast('H')
+            offset += 2 * period + (-(4 * period) % 4)
+            rings.append((period, data, byte_index, states))
+        return cls(index, rings, backing=mapped)
+    
+    def read(self, lfsr: FibonacciLFSR, count: int):
+        """
+        LFSR'nin bulunduğu konumdan count biti tablodan okur ve
+        register'ı ileri taşır.
+        
+        Args:
+            lfsr: İlerletilecek register
+            count: Okunacak bit sayısı
+            
+        Returns:
+            Paketli bitler (mümkünse kopyasız memoryview) veya ring byte
+            hizalı okunamıyorsa None
+        """
+        index = self.index
+        state = lfsr.state
+        
+        # Döngüye girene kadar (geçiş bölgesi) normal ilerle
+        prefix = 0
+        prefix_bits = 0
+        entry = index[state]
+        while entry < 0 and prefix_bits < count:
+            prefix |= (state & 1) << prefix_bits
+            prefix_bits += 1
+            state = FibonacciLFSR._advance(state, 1)
+            entry = index[state]
+        
+        remaining = count - prefix_bits
+        if not remaining:
+            lfsr.state = state
+            lfsr.position += count
+            return prefix.to_bytes((count + 7) // 8, 'little')
+        
+        ring_id, offset = entry >> 16, entry & 0xFFFF
+        period, data, byte_index, states = self.rings[ring_id]
+        start = byte_index[offset]
+        if start == 0xFFFF:
+            lfsr.state = state
+            lfsr.position += prefix_bits
+            body = lfsr._generate_words(remaining)
+            value = prefix | (int.from_bytes(body, 'little') << prefix_bits)
+            return value.to_bytes((count + 7) // 8, 'little')
+        
+        nbytes = (remaining + 7) // 8
+        if start + nbytes <= period:
+            body = data[start:start + nbytes]
+        else:
+            # Halka sonundan başa sar (P byte = 8 tam periyot)
+            ring_bytes = self._ring_bytes[ring_id]
+            full, part = divmod(nbytes - (period - start), period)
+            body = ring_bytes[start:] + ring_bytes * full + ring_bytes[:part]
+        
+        lfsr.state = states[(offset + remaining) % period]
+        lfsr.position += count
+        
+        if prefix_bits or remaining & 7:
+            value = int.from_bytes(body, 'little') & ((1 << remaining) - 1)
+            value = prefix | (value << prefix_bits)
+            return value.to_bytes((count + 7) // 8, 'little')
+        return body
+
+
 class LogisticMap:
     """
     Logistic Map Kaotik Dönüşüm.
@@ -165,21 +996,32 @@ class LogisticMap:
         # x0'ı geçerli aralığa sınırla
         self.x = max(0.001, min(0.999, x0))
         self.initial_x = self.x
+        self.position = 0  # Başlangıçtan beri yapılan iterasyon sayısı
+        
+        # from_integer ile bağlanan önbellek ve yörünge sınıfı
+        self.cache: Optional['LogisticBitCache'] = None
+        self.cache_class = -1
     
     @classmethod
-    def from_integer(cls, seed: int) -> 'LogisticMap':
+    def from_integer(cls, seed: int,
+                     cache: Optional['LogisticBitCache'] = None) -> 'LogisticMap':
         """
         Tam sayıdan LogisticMap oluşturur.
         
         Args:
             seed: Tam sayı tohum değeri
+            cache: İsteğe bağlı yörünge sınıfı bit önbelleği
             
         Returns:
             LogisticMap instance
         """
         # Seed'i 0-1 aralığına normalize et
         x0 = (seed % 997 + 1) / 999.0  # 0.001 - 0.998 arası
-        return cls(x0)
+        logistic = cls(x0)
+        if cache is not None:
+            logistic.cache = cache
+            logistic.cache_class = seed % 997
+        return logistic
     
     def step(self) -> float:
         """
@@ -189,6 +1031,7 @@ class LogisticMap:
             Yeni x değeri
         """
         self.x = self.R * self.x * (1 - self.x)
+        self.position += 1
         return self.x
     
     def generate_bit(self) -> int:
@@ -201,21 +1044,403 @@ class LogisticMap:
         self.step()
         return 1 if self.x >= 0.5 else 0
     
-    def generate_bits(self, count: int) -> List[int]:
+    def generate_packed(self, count: int) -> bytes:
         """
-        Belirtilen sayıda bit üretir.
+        Belirtilen sayıda biti paketli olarak üretir.
+        
+        step() ile aynı işlem sırasını kullanır, bu yüzden çıktı
+        generate_bit() çağrılarıyla bit bit aynıdır.
+        
+        Önbellek bağlıysa ufuk içindeki bitler önbellekten okunur ve x,
+        en yakın kontrol noktasından tam olarak yeniden kurulur.
         
         Args:
             count: Üretilecek bit sayısı
             
         Returns:
-            Bit listesi
+            LSB-first paketlenmiş byte dizisi
         """
-        return [self.generate_bit() for _ in range(count)]
-    
+        cache = self.cache
+        if cache is None or self.position >= cache.horizon:
+            return self._generate_live(count)
+        
+        take = min(count, cache.horizon - self.position)
+        head = cache.read(self.cache_class, self.position, take)
+        self._restore(self.position + take)
+        if take == count:
+            return head
+        
+        # Ufkun ötesi: canlı iterasyona geri dön
+        tail = self._generate_live(count - take)
+        value = int.from_bytes(head, 'little') | (int.from_bytes(tail, 'little') << take)
+        return value.to_bytes((count + 7) // 8, 'little')
+    
+    def _generate_live(self, count: int) -> bytes:
+        """generate_packed'in iterasyon yolu."""
+        out = bytearray((count + 7) // 8)
+        r = self.R
+        x = self.x
+        for i in range(count):
+            x = r * x * (1 - x)
+            if x >= 0.5:
+                out[i >> 3] |= 1 << (i & 7)
+        self.x = x
+        self.position += count
+        return bytes(out)
+    
+    def _restore(self, position: int):
+        """x'i önbellek kontrol noktasından verilen konuma tam olarak kurar."""
+        stride = self.cache.CHECKPOINT_BITS
+        base = position - position % stride
+        self.x = self.cache.checkpoint(self.cache_class, base // stride)
+        self.position = base
+        r = self.R
+        x = self.x
+        for _ in range(position - base):
+            x = r * x * (1 - x)
+        self.x = x
+        self.position = position
+    
+    def generate_bits(self, count: int) -> List[int]:
+        """
+        Belirtilen sayıda bit üretir.
+        
+        Args:
+            count: Üretilecek bit sayısı
+            
+        Returns:
+            Bit listesi
+        """
+        return unpack_bits(self.generate_packed(count), count)
+    
     def reset(self):
         """Başlangıç durumuna sıfırlar."""
         self.x = self.initial_x
+        self.position = 0
+
+
+class LogisticMapBank:
+    """
+    Birbirinden bağımsız çok sayıda Logistic Map'i birlikte ilerleten
+    NumPy tabanlı banka.
+    
+    Her şerit (lane) bir LogisticMap'e karşılık gelir. Tüm şeritler tek
+    bir float64 dizisi olarak aynı IEEE işlem sırasıyla, yani
+    (R * x) * (1 - x), ilerletilir; bu yüzden her şeridin çıktısı
+    skaler sınıfla bit bit aynıdır.
+    
+    NumPy gerektirir.
+    """
+    
+    R = LogisticMap.R
+    
+    # generate_packed'in tek seferde işlediği adım sayısı (bellek sınırı)
+    BLOCK_STEPS = 4096
+    
+    def __init__(self, x0s: Sequence[float]):
+        """
+        Args:
+            x0s: Şerit başına başlangıç değerleri (0 < x0 < 1)
+        """
+        if np is None:
+            raise ImportError("LogisticMapBank için NumPy gereklidir")
+        # LogisticMap ile aynı sınırlama
+        self.x = np.array([max(0.001, min(0.999, x0)) for x0 in x0s], dtype=np.float64)
+        self.initial_x = self.x.copy()
+        self._scratch = np.empty_like(self.x)
+    
+    @classmethod
+    def from_integers(cls, seeds: Sequence[int]) -> 'LogisticMapBank':
+        """
+        Tam sayı tohumlardan banka oluşturur (LogisticMap.from_integer ile aynı).
+        
+        Args:
+            seeds: Şerit başına tohum değerleri
+            
+        Returns:
+            LogisticMapBank instance
+        """
+        return cls([(seed % 997 + 1) / 999.0 for seed in seeds])
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def step(self):
+        """
+        Tüm şeritleri bir iterasyon ilerletir.
+        
+        Returns:
+            Yeni x değerleri (yerinde güncellenen dizi)
+        """
+        x = self.x
+        scratch = self._scratch
+        np.multiply(self.R, x, out=scratch)   # R * x
+        np.subtract(1.0, x, out=x)            # 1 - x
+        np.multiply(scratch, x, out=x)        # (R * x) * (1 - x)
+        return x
+    
+    def generate_bits(self, count: int):
+        """
+        Her şerit için count bit üretir.
+        
+        Args:
+            count: Şerit başına bit sayısı
+            
+        Returns:
+            (şerit, count) boyutlu uint8 dizisi
+        """
+        bits = np.empty((count, len(self.x)), dtype=np.bool_)
+        for i in range(count):
+            np.greater_equal(self.step(), 0.5, out=bits[i])
+        return bits.T.astype(np.uint8)
+    
+    def generate_packed(self, count: int):
+        """
+        Her şerit için count biti paketli olarak üretir.
+        
+        Args:
+            count: Şerit başına bit sayısı
+            
+        Returns:
+            (şerit, ceil(count / 8)) boyutlu uint8 dizisi; her satır
+            LogisticMap.generate_packed çıktısıyla aynıdır
+        """
+        lanes = len(self.x)
+        out = np.empty(((count + 7) // 8, lanes), dtype=np.uint8)
+        block = self.BLOCK_STEPS - self.BLOCK_STEPS % 8
+        bits = np.empty((min(block, count), lanes), dtype=np.bool_)
+        done = 0
+        while done < count:
+            steps = min(block, count - done)
+            for i in range(steps):
+                np.greater_equal(self.step(), 0.5, out=bits[i])
+            start = done // 8
+            packed = np.packbits(bits[:steps], axis=0, bitorder='little')
+            out[start:start + len(packed)] = packed
+            done += steps
+        return np.ascontiguousarray(out.T)
+    
+    def lane(self, index: int) -> LogisticMap:
+        """Bir şeridin mevcut durumunu skaler LogisticMap olarak döndürür."""
+        logistic = LogisticMap(float(self.initial_x[index]))
+        logistic.x = float(self.x[index])
+        return logistic
+    
+    def reset(self):
+        """Başlangıç durumuna sıfırlar."""
+        self.x[:] = self.initial_x
+
+
+class LogisticBitCache:
+    """
+    LogisticMap.from_integer yörünge sınıfları için bit önbelleği.
+    
+    from_integer her tohumu x0 = (seed % 997 + 1) / 999 değerine
+    eşlediğinden tüm tohumlar yalnızca 997 farklı yörünge üretir. Önbellek
+    her sınıfın ilk horizon bitini paketli olarak ve her
+    CHECKPOINT_BITS iterasyonda bir x değerini (tam float) tutar; böylece
+    okuma sonrası x en fazla 63 iterasyonla kesin olarak kurulur.
+    
+    Veriler ya build_file() ile üretilmiş, mmap ile açılan bir dosyadan
+    ya da bellekteki sıcak sınıfların LRU önbelleğinden gelir.
+    """
+    
+    CLASSES = 997
+    CHECKPOINT_BITS = 64
+    MAGIC = b'LGBC'
+    VERSION = 1
+    
+    # Dosya başlığı: magic, sürüm, ufuk (bit), sınıf sayısı
+    _HEADER = struct.Struct('<4sHxxQI')
+    
+    def __init__(self, horizon: int = 1 << 16, capacity: int = 64):
+        """
+        Args:
+            horizon: Sınıf başına önbelleğe alınan bit sayısı
+                (CHECKPOINT_BITS'in katına yuvarlanır)
+            capacity: Bellekte tutulacak en fazla sınıf sayısı (LRU)
+        """
+        stride = self.CHECKPOINT_BITS
+        self.horizon = (horizon + stride - 1) // stride * stride
+        self.capacity = capacity
+        self._hot: 'OrderedDict[int, Tuple[bytes, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._mapped = None
+        self._view: Optional[memoryview] = None
+    
+    @property
+    def _class_size(self) -> int:
+        """Dosyada bir sınıfın kapladığı byte sayısı."""
+        return self.horizon // 8 + 8 * (self.horizon // self.CHECKPOINT_BITS + 1)
+    
+    @classmethod
+    def _compute(cls, classes: Sequence[int], horizon: int) -> List[Tuple[bytes, bytes]]:
+        """
+        Verilen sınıfların bitlerini ve kontrol noktalarını ('<d' dizisi)
+        canlı üretir.
+        """
+        stride = cls.CHECKPOINT_BITS
+        if np is not None and len(classes) > 1:
+            bank = LogisticMapBank.from_integers(classes)
+            blocks = []
+            checkpoints = [bank.x.copy()]
+            for _ in range(horizon // stride):
+                blocks.append(bank.generate_packed(stride))
+                checkpoints.append(bank.x.copy())
+            bits = np.concatenate(blocks, axis=1) if blocks else np.empty((len(classes), 0), np.uint8)
+            points = np.stack(checkpoints, axis=1).astype('<f8')
+            return [(bits[i].tobytes(), points[i].tobytes())
+                    for i in range(len(classes))]
+        
+        result = []
+        for index in classes:
+            logistic = LogisticMap.from_integer(index)
+            chunks = []
+            points = [logistic.x]
+            for _ in range(horizon // stride):
+                chunks.append(logistic.generate_packed(stride))
+                points.append(logistic.x)
+            result.append((b''.join(chunks), struct.pack('<{}d'.format(len(points)), *points)))
+        return result
+    
+    @classmethod
+    def build_file(cls, path: str, horizon: int = 1 << 16):
+        """
+        Tüm sınıflar için önbellek dosyası üretir (NumPy varsa şeritli).
+        
+        Args:
+            path: Hedef dosya yolu
+            horizon: Sınıf başına bit sayısı
+        """
+        cache = cls(horizon)
+        with open(path, 'wb') as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, cache.horizon, cls.CLASSES))
+            for start in range(0, cls.CLASSES, 128):
+                classes = range(start, min(start + 128, cls.CLASSES))
+                for bits, points in cls._compute(classes, cache.horizon):
+                    f.write(bits)
+                    f.write(points)
+    
+    @classmethod
+    def load(cls, path: str, capacity: int = 64) -> 'LogisticBitCache':
+        """
+        build_file() ile yazılmış önbelleği kopyalamadan (mmap) açar.
+        
+        Args:
+            path: Önbellek dosyası
+            capacity: Dosyada olmayan durumlar için LRU kapasitesi
+            
+        Returns:
+            LogisticBitCache instance
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, horizon, classes = cls._HEADER.unpack_from(mapped)
+        if magic != cls.MAGIC or version != cls.VERSION or classes != cls.CLASSES:
+            raise ValueError("Geçersiz Logistic önbellek dosyası")
+        cache = cls(horizon, capacity)
+        cache._mapped = mapped
+        cache._view = memoryview(mapped)
+        return cache
+    
+    def _entry(self, index: int):
+        """Sınıfın (bitler, kontrol_noktaları) kaydını döndürür."""
+        if self._view is not None:
+            offset = self._HEADER.size + index * self._class_size
+            split = offset + self.horizon // 8
+            return self._view[offset:split], self._view[split:offset + self._class_size]
+        
+        # LRU birden çok iş parçacığından paylaşılabilir
+        with self._lock:
+            entry = self._hot.get(index)
+            if entry is not None:
+                self._hot.move_to_end(index)
+                return entry
+        entry = self._compute([index], self.horizon)[0]
+        with self._lock:
+            self._hot[index] = entry
+            if len(self._hot) > self.capacity:
+                self._hot.popitem(last=False)
+        return entry
+    
+    def read(self, index: int, position: int, count: int) -> bytes:
+        """
+        Bir sınıfın bit akışından paketli dilim okur.
+        
+        Args:
+            index: Yörünge sınıfı (seed % 997)
+            position: Başlangıç bit konumu
+            count: Okunacak bit sayısı (position + count <= horizon)
+            
+        Returns:
+            LSB-first paketlenmiş count bit
+        """
+        bits = self._entry(index)[0]
+        if not position & 7:
+            data = bytes(bits[position >> 3:(position + count + 7) >> 3])
+            if count & 7:
+                value = int.from_bytes(data, 'little') & ((1 << count) - 1)
+                return value.to_bytes(len(data), 'little')
+            return data
+        value = int.from_bytes(bits[position >> 3:(position + count + 7) // 8 + 1], 'little')
+        value = (value >> (position & 7)) & ((1 << count) - 1)
+        return value.to_bytes((count + 7) // 8, 'little')
+    
+    def checkpoint(self, index: int, slot: int) -> float:
+        """
+        slot * CHECKPOINT_BITS iterasyon sonraki x değerini döndürür.
+        
+        Args:
+            index: Yörünge sınıfı
+            slot: Kontrol noktası sırası (0 = başlangıç)
+            
+        Returns:
+            Kesin x değeri
+        """
+        return struct.unpack_from('<d', self._entry(index)[1], 8 * slot)[0]
+
+
+def _peres_tables() -> Tuple[bytes, bytes, List[int], List[int]]:
+    """
+    Peres yinelemesi için byte tabloları.
+    
+    Returns:
+        (çift XOR'u -> düşük nibble, çift XOR'u -> yüksek nibble,
+         eşit çiftlerin bitleri, eşit çift sayısı)
+    """
+    xor_low = bytearray(256)
+    equal_bits = []
+    equal_counts = []
+    for byte in range(256):
+        bits = 0
+        count = 0
+        for i in range(4):
+            pair = (byte >> (2 * i)) & 3
+            xor_low[byte] |= ((pair ^ (pair >> 1)) & 1) << i
+            if pair == 0 or pair == 3:  # 00 -> 0, 11 -> 1
+                bits |= (pair & 1) << count
+                count += 1
+        equal_bits.append(bits)
+        equal_counts.append(count)
+    xor_high = bytes((value << 4) & 0xFF for value in xor_low)
+    return bytes(xor_low), xor_high, equal_bits, equal_counts
+
+
+def _von_neumann_tables() -> Tuple[List[int], List[int]]:
+    """Her byte'ın 4 çiftinden çıkan bitleri ve bit sayısını tablolar."""
+    table_bits = []
+    table_counts = []
+    for byte in range(256):
+        bits = 0
+        count = 0
+        for shift in range(0, 8, 2):
+            pair = (byte >> shift) & 3
+            if pair == 1 or pair == 2:  # 10 -> 1, 01 -> 0
+                bits |= (pair & 1) << count
+                count += 1
+        table_bits.append(bits)
+        table_counts.append(count)
+    return table_bits, table_counts
 
 
 class VonNeumannExtractor:
@@ -228,8 +1453,24 @@ class VonNeumannExtractor:
     - 00 ve 11 -> atılır
     
     Bu yöntem bias'lı girdiyi dengeli çıktıya dönüştürür.
+    
+    Paketli girişte her byte 4 çift içerir; 256 elemanlı tablolar her
+    byte'ı 0-4 çıktı bitine ve bu bitlerin sayısına eşler.
     """
     
+    # byte -> (çıktı bitleri, çıktı bit sayısı)
+    TABLE_BITS, TABLE_COUNTS = _von_neumann_tables()
+    
+    # Peres (yinelemeli Von Neumann) tabloları ve varsayılan derinlik
+    _XOR_LOW, _XOR_HIGH, _EQUAL_BITS, _EQUAL_COUNTS = _peres_tables()
+    PERES_DEPTH = 6
+    # İzin verilen en büyük derinlik (snapshot() derinliği tek byte saklar)
+    MAX_PERES_DEPTH = 255
+    
+    # Çıkarıcı kipleri
+    CLASSIC = 'vonneumann'
+    PERES = 'peres'
+    
     @staticmethod
     def extract(bits: List[int]) -> List[int]:
         """
@@ -241,16 +1482,119 @@ class VonNeumannExtractor:
         Returns:
             Dengelenmiş bit dizisi
         """
-        result = []
-        i = 0
-        while i < len(bits) - 1:
-            if bits[i] == 0 and bits[i + 1] == 1:
-                result.append(0)
-            elif bits[i] == 1 and bits[i + 1] == 0:
-                result.append(1)
-            # 00 ve 11 atılır
-            i += 2
-        return result
+        return unpack_bits(*VonNeumannExtractor.extract_packed(pack_bits(bits), len(bits)))
+    
+    @staticmethod
+    def extract_packed(data: bytes, count: int) -> Tuple[bytes, int]:
+        """
+        Paketli bit dizisini byte tablosuyla dengeler.
+        
+        Args:
+            data: LSB-first paketlenmiş giriş (bytes, bytearray veya memoryview)
+            count: Girişteki geçerli bit sayısı
+            
+        Returns:
+            (paketli_çıktı, çıktı_bit_sayısı) tuple'ı
+        """
+        table_bits = VonNeumannExtractor.TABLE_BITS
+        table_counts = VonNeumannExtractor.TABLE_COUNTS
+        full, rest = divmod(count // 2, 4)
+        
+        out = bytearray()
+        acc = 0
+        n = 0
+        for byte in memoryview(data)[:full]:
+            k = table_counts[byte]
+            if k:
+                acc |= table_bits[byte] << n
+                n += k
+                if n >= 32:
+                    out += (acc & 0xFFFFFFFF).to_bytes(4, 'little')
+                    acc >>= 32
+                    n -= 32
+        if rest:
+            # Son byte'taki eksik çiftleri 00 yaparak at
+            byte = data[full] & ((1 << (2 * rest)) - 1)
+            acc |= table_bits[byte] << n
+            n += table_counts[byte]
+        
+        total = (len(out) << 3) + n
+        out += acc.to_bytes((n + 7) // 8, 'little')
+        return bytes(out), total
+    
+    @staticmethod
+    def extract_peres_packed(data: bytes, count: int,
+                             depth: int = PERES_DEPTH) -> Tuple[bytes, int]:
+        """
+        Paketli bit dizisini Peres yöntemiyle dengeler.
+        
+        Klasik Von Neumann çıktısına, atılan bilgiyi geri kazanan iki
+        yinelemenin çıktısı eklenir:
+        Ψ(x) = VN(x) ‖ Ψ(u) ‖ Ψ(v)
+        u: her çiftin XOR'u, v: eşit (00/11) çiftlerin biti.
+        depth = 1 klasik Von Neumann'a eşittir.
+        
+        Args:
+            data: LSB-first paketlenmiş giriş
+            count: Girişteki geçerli bit sayısı
+            depth: Yineleme derinliği
+            
+        Returns:
+            (paketli_çıktı, çıktı_bit_sayısı) tuple'ı
+        """
+        cls = VonNeumannExtractor
+        pairs = count // 2
+        if depth <= 0 or pairs == 0:
+            return b'', 0
+        
+        full, rest = divmod(pairs, 4)
+        source = bytes(memoryview(data)[:full + (1 if rest else 0)])
+        if rest:
+            # Son byte'taki eksik çiftleri maskele (u ve v'den ayrıca kırpılır)
+            source = source[:-1] + bytes([source[-1] & ((1 << (2 * rest)) - 1)])
+        
+        balanced, produced = cls.extract_packed(source, 2 * pairs)
+        if depth == 1:
+            return balanced, produced
+        
+        # u: çift XOR'ları, byte başına 4 bit; iki byte bir çıktı byte'ı
+        low = source[0::2].translate(cls._XOR_LOW)
+        high = source[1::2].translate(cls._XOR_HIGH)
+        u_value = int.from_bytes(low, 'little') | int.from_bytes(high, 'little')
+        u_data = u_value.to_bytes(len(low), 'little')
+        
+        # v: eşit çiftlerin bitleri (değişken uzunluk)
+        equal_bits = cls._EQUAL_BITS
+        equal_counts = cls._EQUAL_COUNTS
+        v_out = bytearray()
+        acc = 0
+        n = 0
+        for byte in memoryview(source)[:full]:
+            k = equal_counts[byte]
+            if k:
+                acc |= equal_bits[byte] << n
+                n += k
+                if n >= 32:
+                    v_out += (acc & 0xFFFFFFFF).to_bytes(4, 'little')
+                    acc >>= 32
+                    n -= 32
+        for i in range(rest):
+            # Son byte: maskelenmiş çiftler eşit çift sayılmamalı
+            pair = (source[full] >> (2 * i)) & 3
+            if pair == 0 or pair == 3:
+                acc |= (pair & 1) << n
+                n += 1
+        v_count = (len(v_out) << 3) + n
+        v_out += acc.to_bytes((n + 7) // 8, 'little')
+        
+        u_result, u_count = cls.extract_peres_packed(u_data, pairs, depth - 1)
+        v_result, v_produced = cls.extract_peres_packed(bytes(v_out), v_count, depth - 1)
+        
+        value = (int.from_bytes(balanced, 'little')
+                 | int.from_bytes(u_result, 'little') << produced
+                 | int.from_bytes(v_result, 'little') << (produced + u_count))
+        total = produced + u_count + v_produced
+        return value.to_bytes((total + 7) // 8, 'little'), total
 
 
 class CollatzChaosRSU:
@@ -265,116 +1609,705 @@ class CollatzChaosRSU:
     Çıktı: LFSR XOR LogisticMap sonucu Von Neumann ile dengelenir
     """
     
-    def __init__(self, seed: int):
+    # Peres kipinde çıkarıcıya verilen sabit ham blok boyutu (bit)
+    PERES_BLOCK_BITS = 4096
+    
+    # Klasik kipte bir çağrıdan devredebilecek en fazla dengeli bit
+    CARRY_BITS = 256
+    
+    # readinto'nun tek adımda ürettiği byte sayısı (ara bellek sınırı)
+    READ_CHUNK = 1 << 16
+    
+    # __iter__'in verdiği parça boyutu (byte)
+    ITER_CHUNK = 4096
+    
+    # Entropi havuzu boşaldığında akıştan bir kerede çekilen byte sayısı
+    ENTROPY_BYTES = 64
+    
+    # build_index'in varsayılan kontrol noktası aralığı (çıktı biti)
+    INDEX_INTERVAL = 1 << 16
+    
+    # snapshot() biçimi: magic, sürüm, çıkarıcı, Peres derinliği, tohum,
+    # LFSR durumu/konumu, Logistic x/konumu, dört sayaç, devreden bitler
+    # (sayı + alan) ve entropi havuzu (sayı + alan)
+    SNAPSHOT_MAGIC = b'CRSU'
+    SNAPSHOT_VERSION = 1
+    _SNAPSHOT = struct.Struct('<4sHBB16sHQdQQQQQH{}sH{}s'.format(
+        max(CARRY_BITS, PERES_BLOCK_BITS) // 8, ENTROPY_BYTES))
+    
+    def __init__(self, seed: int, lfsr_table: Optional[LFSRKeystreamTable] = None,
+                 logistic_cache: Optional[LogisticBitCache] = None,
+                 extractor: str = VonNeumannExtractor.CLASSIC,
+                 peres_depth: int = VonNeumannExtractor.PERES_DEPTH,
+                 history_bits: int = 0):
         """
         Args:
             seed: Ana tohum değeri
+            lfsr_table: İsteğe bağlı paylaşılan LFSR tablosu
+                (ör. LFSRKeystreamTable.shared())
+            logistic_cache: İsteğe bağlı Logistic yörünge önbelleği
+            extractor: 'vonneumann' (klasik, varsayılan) veya 'peres'
+            peres_depth: Peres kipinde yineleme derinliği
+                (1..VonNeumannExtractor.MAX_PERES_DEPTH)
+            history_bits: raw_bits / generated_bits için saklanacak son
+                bit sayısı (0: geçmiş tutulmaz)
         """
+        if extractor not in (VonNeumannExtractor.CLASSIC, VonNeumannExtractor.PERES):
+            raise ValueError("Bilinmeyen çıkarıcı: {}".format(extractor))
+        if not 1 <= peres_depth <= VonNeumannExtractor.MAX_PERES_DEPTH:
+            raise ValueError("Peres derinliği 1 ile {} arasında olmalıdır".format(
+                VonNeumannExtractor.MAX_PERES_DEPTH))
         self.seed = seed
+        self.extractor = extractor
+        self.peres_depth = peres_depth
+        self._collatz: Optional[CollatzGenerator] = None
         
-        # Collatz dizisi üret
-        self.collatz = CollatzGenerator(seed)
-        self.collatz.generate_sequence()
-        
-        # Collatz'dan alt tohumları üret
-        collatz_bits = self.collatz.get_bits()
-        lfsr_seed = self.collatz.get_seed_from_bits(collatz_bits)
+        # Collatz'dan alt tohumları üret (dizi üretmeden, tablo ile)
+        lfsr_seed = CollatzGenerator.lfsr_seed_for(seed)
         
         # Alt bileşenleri başlat
-        self.lfsr = FibonacciLFSR(lfsr_seed)
-        self.logistic = LogisticMap.from_integer(seed)
+        self.lfsr = FibonacciLFSR(lfsr_seed, table=lfsr_table)
+        self.logistic = LogisticMap.from_integer(seed, cache=logistic_cache)
         
-        # İstatistikler
-        self.generated_bits: List[int] = []
-        self.raw_bits: List[int] = []
+        # İstatistikler (sabit boyutlu sayaçlar)
+        self._total = 0            # Teslim edilen dengeli bit sayısı
+        self._ones = 0             # Bunların içindeki 1'ler
+        self._raw_total = 0        # Çıkarıcıya verilen ham bit sayısı
+        self._extracted_total = 0  # Çıkarıcının ürettiği bit sayısı
+        
+        # İsteğe bağlı sınırlı geçmiş
+        self._raw_history = _BitRing(history_bits) if history_bits > 0 else None
+        self._balanced_history = _BitRing(history_bits) if history_bits > 0 else None
+        
+        # Sonraki çağrıya devreden dengeli bitler (LSB-first)
+        self._pending = 0
+        self._pending_bits = 0
+        
+        # Örnekleme yardımcılarının kullanmadığı bitler (LSB-first)
+        self._entropy = 0
+        self._entropy_bits = 0
+    
+    @staticmethod
+    def substream_seed(seed: int, index: int) -> int:
+        """
+        Ana tohumdan index numaralı alt akışın tohumunu türetir.
+        
+        Tohum ve indeks BLAKE2b ile 64 bitlik pozitif bir değere
+        karıştırılır; sonuç platformdan ve süreçten bağımsızdır.
+        
+        Args:
+            seed: Ana tohum (pozitif)
+            index: Alt akış numarası (>= 0)
+            
+        Returns:
+            Alt akış tohumu
+        """
+        if seed <= 0:
+            raise ValueError("Seed pozitif bir tam sayı olmalıdır")
+        if index < 0:
+            raise ValueError("Alt akış numarası negatif olamaz")
+        digest = hashlib.blake2b(
+            '{}:{}'.format(seed, index).encode('ascii'),
+            digest_size=8, person=b'CollatzRSU').digest()
+        return int.from_bytes(digest, 'little') | 1
+    
+    @classmethod
+    def substream(cls, seed: int, index: int, **kwargs) -> 'CollatzChaosRSU':
+        """
+        Ana tohumun index numaralı bağımsız alt akış üretecini döndürür.
+        
+        Args:
+            seed: Ana tohum
+            index: Alt akış numarası
+            **kwargs: CollatzChaosRSU'ya aktarılan ek parametreler
+            
+        Returns:
+            CollatzChaosRSU instance
+        """
+        return cls(cls.substream_seed(seed, index), **kwargs)
+    
+    @property
+    def collatz(self) -> CollatzGenerator:
+        """Tohumun Collatz üreteci (dizi ilk erişimde üretilir)."""
+        if self._collatz is None:
+            self._collatz = CollatzGenerator(self.seed)
+            self._collatz.generate_sequence()
+        return self._collatz
+    
+    @property
+    def generated_bits(self) -> List[int]:
+        """Son history_bits dengeli bit (geçmiş kapalıysa boş liste)."""
+        if self._balanced_history is None:
+            return []
+        return self._balanced_history.bits()
+    
+    @property
+    def raw_bits(self) -> List[int]:
+        """Son history_bits ham bit (geçmiş kapalıysa boş liste)."""
+        if self._raw_history is None:
+            return []
+        return self._raw_history.bits()
+    
+    def generate_raw_packed(self, count: int) -> bytes:
+        """
+        Ham bitleri paketli olarak üretir (XOR birleştirme).
+        
+        Args:
+            count: Üretilecek bit sayısı
+            
+        Returns:
+            LSB-first paketlenmiş ham bitler
+        """
+        lfsr_data = self.lfsr.generate_packed(count)
+        logistic_data = self.logistic.generate_packed(count)
+        
+        # XOR birleştirme (tek büyük tamsayı işlemi)
+        raw = xor_packed(lfsr_data, logistic_data)
+        if self._raw_history is not None:
+            self._raw_history.append(raw, count)
+        return raw
+    
+    def generate_raw_bits(self, count: int) -> List[int]:
+        """
+        Ham bitler üretir (XOR birleştirme).
+        
+        Args:
+            count: Üretilecek bit sayısı
+            
+        Returns:
+            Ham bit dizisi
+        """
+        return unpack_bits(self.generate_raw_packed(count), count)
+    
+    def _extract_chunk(self, count: int) -> Tuple[bytes, int]:
+        """
+        İhtiyaca göre boyutlanmış bir ham parça üretip seçili çıkarıcıdan
+        geçirir.
+        
+        Klasik kipte verim yaklaşık 1/4'tür, bu yüzden yaklaşık 4 * count
+        ham bit istenir. Her çift en fazla bir bit verdiğinden parça
+        2 * count + 2 * CARRY_BITS ile sınırlanır; böylece artan bitler
+        hiçbir zaman CARRY_BITS'i aşmaz. Ham parça her zaman çift
+        uzunlukta olduğundan çift hizası çağrılar arasında korunur.
+        Peres kipi sabit bloklarla çalışır. Her iki kipte de artan
+        bitler _pending'e devreder.
+        
+        Args:
+            count: Hâlâ ihtiyaç duyulan dengeli bit sayısı
+            
+        Returns:
+            (paketli_çıktı, çıktı_bit_sayısı) tuple'ı
+        """
+        if self.extractor == VonNeumannExtractor.PERES:
+            raw_count = self.PERES_BLOCK_BITS
+            raw = self.generate_raw_packed(raw_count)
+            balanced, produced = VonNeumannExtractor.extract_peres_packed(
+                raw, raw_count, self.peres_depth)
+        else:
+            raw_count = min(4 * count + 64, 2 * (count + self.CARRY_BITS))
+            raw = self.generate_raw_packed(raw_count)
+            balanced, produced = VonNeumannExtractor.extract_packed(raw, raw_count)
+        self._raw_total += raw_count
+        self._extracted_total += produced
+        return balanced, produced
+    
+    def generate_balanced_packed(self, count: int) -> bytes:
+        """
+        Dengelenmiş bitleri paketli olarak üretir.
+        
+        Önceki çağrıdan devreden bitler önce kullanılır ve ham bitler
+        yalnızca eksik kalan kadar üretilir. Böylece ardışık çağrılar tek
+        bir büyük çağrıyla aynı akışı verir.
+        
+        Args:
+            count: İstenen bit sayısı
+            
+        Returns:
+            LSB-first paketlenmiş count bit
+        """
+        if count < 0:
+            raise ValueError("Bit sayısı negatif olamaz")
+        # Devreden bitlerle başla
+        have = min(count, self._pending_bits)
+        result = self._pending & ((1 << have) - 1)
+        self._pending >>= have
+        self._pending_bits -= have
+        
+        # Yeterli bit toplanana kadar üret
+        while have < count:
+            balanced, produced = self._extract_chunk(count - have)
+            result |= int.from_bytes(balanced, 'little') << have
+            have += produced
+        
+        # Fazlayı sonraki çağrıya devret
+        if have > count:
+            self._pending = result >> count
+            self._pending_bits = have - count
+            result &= (1 << count) - 1
+        packed = result.to_bytes((count + 7) // 8, 'little')
+        self._total += count
+        self._ones += bin(result).count('1')
+        if self._balanced_history is not None:
+            self._balanced_history.append(packed, count)
+        return packed
+    
+    def generate_balanced_bits(self, count: int) -> List[int]:
+        """
+        Dengelenmiş bitler üretir (Von Neumann düzeltici ile).
+        
+        Args:
+            count: Minimum istenen bit sayısı
+            
+        Returns:
+            Dengelenmiş bit dizisi
+        """
+        return unpack_bits(self.generate_balanced_packed(count), count)
+    
+    def generate_bytes(self, count: int) -> bytes:
+        """
+        Rastgele byte'lar üretir.
+        
+        Args:
+            count: Üretilecek byte sayısı
+            
+        Returns:
+            Byte dizisi
+        """
+        return self.generate_balanced_packed(count * 8)
+    
+    def readinto(self, buffer) -> int:
+        """
+        Yazılabilir bir tamponu (bytearray, memoryview, mmap, NumPy dizisi
+        vb.) yerinde rastgele byte'larla doldurur.
+        
+        Tampon READ_CHUNK'lık parçalar halinde doldurulur; tampon boyutunda
+        bir ara kopya oluşmaz. Ardışık çağrılar akışı kaldığı yerden sürdürür.
+        
+        Args:
+            buffer: Buffer protokolünü destekleyen yazılabilir nesne
+            
+        Returns:
+            Yazılan byte sayısı
+        """
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("readinto yazılabilir bir tampon gerektirir")
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        
+        total = len(view)
+        for start in range(0, total, self.READ_CHUNK):
+            end = min(start + self.READ_CHUNK, total)
+            view[start:end] = self.generate_balanced_packed((end - start) * 8)
+        return total
+    
+    def read(self, size: int) -> bytes:
+        """
+        Dosya benzeri okuma: size byte döndürür.
+        
+        Akış sonsuz olduğundan boyutsuz okuma desteklenmez.
+        
+        Args:
+            size: Okunacak byte sayısı
+            
+        Returns:
+            Byte dizisi
+        """
+        if size is None or size < 0:
+            raise ValueError("Sonsuz akışta boyut belirtilmelidir")
+        return self.generate_bytes(size)
+    
+    def iter_chunks(self, size: int) -> Generator[bytes, None, None]:
+        """
+        Sabit boyutlu parçaları sonsuza kadar üretir.
+        
+        Args:
+            size: Parça boyutu (byte)
+            
+        Yields:
+            size byte'lık parçalar
+        """
+        if size <= 0:
+            raise ValueError("Parça boyutu pozitif olmalıdır")
+        while True:
+            yield self.generate_bytes(size)
+    
+    def __iter__(self) -> Generator[bytes, None, None]:
+        """ITER_CHUNK byte'lık parçaları sonsuz olarak üretir."""
+        return self.iter_chunks(self.ITER_CHUNK)
+    
+    def generate_array(self, shape, dtype='uint8'):
+        """
+        Anahtar akışından doğrudan bir NumPy dizisi üretir.
+        
+        İşaretsiz tamsayı tiplerinde dizi little-endian olarak readinto ile
+        yerinde doldurulur; böylece aynı tohum her platformda aynı değerleri
+        verir. float64 için her eleman 64 bitlik bir kelimenin üst 53
+        bitinden [0, 1) aralığında düzgün dağılımlı olarak kurulur.
+        
+        NumPy gerektirir.
+        
+        Args:
+            shape: Dizi boyutu (int veya tuple)
+            dtype: 'uint8', 'uint16', 'uint32', 'uint64' veya 'float64'
+            
+        Returns:
+            İstenen tip ve boyutta NumPy dizisi
+        """
+        if np is None:
+            raise ImportError("generate_array için NumPy gereklidir")
+        dtype = np.dtype(dtype)
+        
+        if dtype == np.float64:
+            words = np.empty(shape, dtype='<u8')
+            self.readinto(words)
+            return (words >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+        
+        if dtype.kind != 'u':
+            raise ValueError("Desteklenmeyen tip: {}".format(dtype))
+        result = np.empty(shape, dtype=dtype.newbyteorder('<'))
+        self.readinto(result)
+        return result.astype(dtype, copy=False)
+    
+    def getrandbits(self, k: int) -> int:
+        """
+        k rastgele bitten oluşan negatif olmayan bir tamsayı döndürür.
+        
+        Bitler bir entropi havuzundan tek tek alınır; kullanılmayan bitler
+        sonraki çekilişlere kalır, böylece hiçbir çekiliş tam byte israf
+        etmez. Havuz ENTROPY_BYTES'lık parçalarla akıştan doldurulur.
+        
+        Args:
+            k: Bit sayısı
+            
+        Returns:
+            0 <= r < 2**k
+        """
+        if k < 0:
+            raise ValueError("Bit sayısı negatif olamaz")
+        while self._entropy_bits < k:
+            size = max(self.ENTROPY_BYTES, (k - self._entropy_bits + 7) >> 3)
+            self._entropy |= int.from_bytes(self.generate_bytes(size), 'little') << self._entropy_bits
+            self._entropy_bits += size * 8
+        result = self._entropy & ((1 << k) - 1)
+        self._entropy >>= k
+        self._entropy_bits -= k
+        return result
+    
+    def randbelow(self, n: int) -> int:
+        """
+        [0, n) aralığında düzgün dağılımlı bir tamsayı döndürür.
+        
+        (n - 1).bit_length() bitlik adaylarla bit düzeyinde reddetme
+        örneklemesi yapar; bir çekiliş ortalama iki adaydan az tüketir.
+        
+        Args:
+            n: Üst sınır (pozitif)
+            
+        Returns:
+            0 <= r < n
+        """
+        if n <= 0:
+            raise ValueError("Üst sınır pozitif olmalıdır")
+        k = (n - 1).bit_length()
+        r = self.getrandbits(k)
+        while r >= n:
+            r = self.getrandbits(k)
+        return r
+    
+    def randint(self, a: int, b: int) -> int:
+        """[a, b] aralığında (uçlar dahil) rastgele bir tamsayı döndürür."""
+        if b < a:
+            raise ValueError("Boş aralık: [{}, {}]".format(a, b))
+        return a + self.randbelow(b - a + 1)
+    
+    def choice(self, seq: Sequence):
+        """Boş olmayan bir diziden rastgele bir eleman seçer."""
+        if not seq:
+            raise IndexError("Boş diziden seçim yapılamaz")
+        return seq[self.randbelow(len(seq))]
+    
+    def shuffle(self, x: list) -> None:
+        """Listeyi yerinde karıştırır (Fisher-Yates)."""
+        for i in reversed(range(1, len(x))):
+            j = self.randbelow(i + 1)
+            x[i], x[j] = x[j], x[i]
+    
+    def sample(self, population: Sequence, k: int) -> list:
+        """
+        Popülasyondan tekrarsız k eleman seçer.
+        
+        Kısmi Fisher-Yates ile yalnızca k çekiliş yapılır.
+        
+        Args:
+            population: Seçim yapılacak dizi
+            k: Seçilecek eleman sayısı
+            
+        Returns:
+            Seçim sırasıyla k elemanlık liste
+        """
+        n = len(population)
+        if not 0 <= k <= n:
+            raise ValueError("Örneklem boyutu 0 ile {} arasında olmalıdır".format(n))
+        pool = list(population)
+        result = [None] * k
+        for i in range(k):
+            j = self.randbelow(n - i)
+            result[i] = pool[j]
+            pool[j] = pool[n - i - 1]
+        return result
+    
+    def randbelow_array(self, n: int, count: int) -> array:
+        """
+        [0, n) aralığında count adet tamsayıyı array('Q') olarak döndürür.
+        
+        Tekli randbelow ile aynı entropi havuzunu ve reddetme
+        örneklemesini kullanır; n en fazla 2**64 olabilir.
+        
+        Args:
+            n: Üst sınır (pozitif, <= 2**64)
+            count: Çekiliş sayısı
+            
+        Returns:
+            count elemanlı array('Q')
+        """
+        if n <= 0 or n > 1 << 64:
+            raise ValueError("Üst sınır 1 ile 2**64 arasında olmalıdır")
+        k = (n - 1).bit_length()
+        getrandbits = self.getrandbits
+        result = array('Q', [0]) * count
+        for i in range(count):
+            r = getrandbits(k)
+            while r >= n:
+                r = getrandbits(k)
+            result[i] = r
+        return result
     
-    def generate_raw_bits(self, count: int) -> List[int]:
+    def randint_array(self, a: int, b: int, count: int) -> array:
         """
-        Ham bitler üretir (XOR birleştirme).
+        [a, b] aralığında count adet tamsayıyı array('q') olarak döndürür.
+        
+        Uçlar işaretli 64 bitlik aralıkta olmalıdır.
         
         Args:
-            count: Üretilecek bit sayısı
+            a: Alt sınır (dahil)
+            b: Üst sınır (dahil)
+            count: Çekiliş sayısı
             
         Returns:
-            Ham bit dizisi
+            count elemanlı array('q')
         """
-        lfsr_bits = self.lfsr.generate_bits(count)
-        logistic_bits = self.logistic.generate_bits(count)
-        
-        # XOR birleştirme
-        raw_bits = [l ^ c for l, c in zip(lfsr_bits, logistic_bits)]
-        self.raw_bits.extend(raw_bits)
-        return raw_bits
+        if b < a:
+            raise ValueError("Boş aralık: [{}, {}]".format(a, b))
+        if a < -(1 << 63) or b >= 1 << 63:
+            raise ValueError("Uçlar işaretli 64 bitlik aralıkta olmalıdır")
+        offsets = self.randbelow_array(b - a + 1, count)
+        return array('q', [a + r for r in offsets])
     
-    def generate_balanced_bits(self, count: int) -> List[int]:
+    def generate_key(self, length: int) -> str:
         """
-        Dengelenmiş bitler üretir (Von Neumann düzeltici ile).
+        Şifreleme anahtarı üretir (hex formatında).
         
         Args:
-            count: Minimum istenen bit sayısı
+            length: Anahtar uzunluğu (byte cinsinden)
             
         Returns:
-            Dengelenmiş bit dizisi
+            Hex formatında anahtar
         """
-        result = []
+        key_bytes = self.generate_bytes(length)
+        return key_bytes.hex()
+    
+    def _get_state(self) -> tuple:
+        """
+        Akışın devamını belirleyen durumu döndürür.
         
-        # Yeterli bit toplanana kadar üret
-        while len(result) < count:
-            # Fazladan bit üret (Von Neumann yaklaşık %50 atar)
-            raw = self.generate_raw_bits(count * 3)
-            balanced = VonNeumannExtractor.extract(raw)
-            result.extend(balanced)
+        Dengeli akış yalnızca ham akışın fonksiyonudur (ham parçalar hep
+        çift hizalı, Peres blokları sabit) ve bir çağrının sonunda ham
+        akış parça sınırındadır. Bu yüzden LFSR durumu, Logistic x'i,
+        konumlar ve devreden bitler devamı tam olarak belirler. Sayaçlar
+        istatistikler içindir; _total aynı zamanda çıktı konumudur.
+        """
+        return (self.lfsr.state, self.lfsr.position,
+                self.logistic.x, self.logistic.position,
+                self._pending, self._pending_bits,
+                self._total, self._ones, self._raw_total, self._extracted_total)
+    
+    def _set_state(self, state: tuple):
+        """_get_state ile alınmış durumu geri yükler (entropi havuzu boşalır)."""
+        (self.lfsr.state, self.lfsr.position,
+         self.logistic.x, self.logistic.position,
+         self._pending, self._pending_bits,
+         self._total, self._ones, self._raw_total, self._extracted_total) = state
+        self._entropy = 0
+        self._entropy_bits = 0
+    
+    def _initial_state(self) -> tuple:
+        """Akışın başlangıç (0. bit) durumu."""
+        return (self.lfsr.initial_state, 0, self.logistic.initial_x, 0,
+                0, 0, 0, 0, 0, 0)
+    
+    def _discard(self, count: int):
+        """count dengeli biti geçmişe yazmadan üretip atar."""
+        histories = self._raw_history, self._balanced_history
+        self._raw_history = self._balanced_history = None
+        try:
+            step = self.READ_CHUNK * 8
+            while count > 0:
+                self.generate_balanced_packed(min(count, step))
+                count -= step
+        finally:
+            self._raw_history, self._balanced_history = histories
+    
+    def snapshot(self) -> bytes:
+        """
+        Üretecin sabit boyutlu ikili anlık görüntüsünü döndürür.
         
-        self.generated_bits = result[:count]
-        return self.generated_bits
+        LFSR durumu, Logistic x'inin tam float bitleri, konumlar, devreden
+        dengeli bitler, entropi havuzu ve sayaçlar saklanır; raw_bits /
+        generated_bits geçmişleri saklanmaz. Devreden bitler klasik kipte
+        CARRY_BITS'i, Peres kipinde bir bloğun verimini (< PERES_BLOCK_BITS)
+        aşmadığından alan sabittir.
+        
+        Returns:
+            _SNAPSHOT.size byte'lık anlık görüntü
+        """
+        if not 0 < self.seed < 1 << 128:
+            raise ValueError("Anlık görüntü 128 bitten büyük tohumları desteklemez")
+        if not 1 <= self.peres_depth <= VonNeumannExtractor.MAX_PERES_DEPTH:
+            raise ValueError("Anlık görüntü Peres derinliğini 1 ile {} arasında saklar".format(
+                VonNeumannExtractor.MAX_PERES_DEPTH))
+        extractor = 1 if self.extractor == VonNeumannExtractor.PERES else 0
+        carry_bytes = max(self.CARRY_BITS, self.PERES_BLOCK_BITS) // 8
+        return self._SNAPSHOT.pack(
+            self.SNAPSHOT_MAGIC, self.SNAPSHOT_VERSION, extractor, self.peres_depth,
+            self.seed.to_bytes(16, 'little'),
+            self.lfsr.state, self.lfsr.position,
+            self.logistic.x, self.logistic.position,
+            self._total, self._ones, self._raw_total, self._extracted_total,
+            self._pending_bits, self._pending.to_bytes(carry_bytes, 'little'),
+            self._entropy_bits, self._entropy.to_bytes(self.ENTROPY_BYTES, 'little'))
     
-    def generate_bytes(self, count: int) -> bytes:
+    @classmethod
+    def restore(cls, data: bytes, lfsr_table: Optional[LFSRKeystreamTable] = None,
+                logistic_cache: Optional[LogisticBitCache] = None,
+                history_bits: int = 0) -> 'CollatzChaosRSU':
         """
-        Rastgele byte'lar üretir.
+        snapshot() çıktısından üreteci O(1) sürede kurar; akış kaldığı
+        bitten aynen devam eder.
         
         Args:
-            count: Üretilecek byte sayısı
+            data: snapshot() çıktısı
+            lfsr_table: İsteğe bağlı paylaşılan LFSR tablosu
+            logistic_cache: İsteğe bağlı Logistic yörünge önbelleği
+            history_bits: Yeni geçmiş boyutu (geçmiş geri yüklenmez)
             
         Returns:
-            Byte dizisi
+            CollatzChaosRSU instance
         """
-        bits = self.generate_balanced_bits(count * 8)
+        if len(data) != cls._SNAPSHOT.size:
+            raise ValueError("Geçersiz anlık görüntü boyutu")
+        (magic, version, extractor, peres_depth, seed,
+         lfsr_state, lfsr_position, x, logistic_position,
+         total, ones, raw_total, extracted_total,
+         pending_bits, pending, entropy_bits, entropy) = cls._SNAPSHOT.unpack(data)
+        if magic != cls.SNAPSHOT_MAGIC or version != cls.SNAPSHOT_VERSION or extractor > 1:
+            raise ValueError("Geçersiz anlık görüntü")
         
-        result = bytearray()
-        for i in range(0, len(bits), 8):
-            byte_bits = bits[i:i + 8]
-            if len(byte_bits) == 8:
-                byte_val = sum(bit << j for j, bit in enumerate(byte_bits))
-                result.append(byte_val)
-        
-        return bytes(result)
+        rsu = cls(int.from_bytes(seed, 'little'), lfsr_table=lfsr_table,
+                  logistic_cache=logistic_cache,
+                  extractor=(VonNeumannExtractor.CLASSIC, VonNeumannExtractor.PERES)[extractor],
+                  peres_depth=peres_depth, history_bits=history_bits)
+        rsu._set_state((lfsr_state, lfsr_position, x, logistic_position,
+                        int.from_bytes(pending, 'little'), pending_bits,
+                        total, ones, raw_total, extracted_total))
+        rsu._entropy = int.from_bytes(entropy, 'little')
+        rsu._entropy_bits = entropy_bits
+        return rsu
     
-    def generate_key(self, length: int) -> str:
+    def build_index(self, total_bits: int,
+                    interval: Optional[int] = None) -> 'KeystreamIndex':
         """
-        Şifreleme anahtarı üretir (hex formatında).
+        Bu üretecin akışı için kontrol noktası indeksi kurar.
+        
+        Akış aynı yapılandırmayla baştan total_bits'e kadar bir kez
+        üretilir ve her interval bitte durum kaydedilir. Bu örneğin
+        konumu değişmez.
         
         Args:
-            length: Anahtar uzunluğu (byte cinsinden)
+            total_bits: İndekslenecek akış uzunluğu (bit)
+            interval: Kontrol noktası aralığı (varsayılan INDEX_INTERVAL)
             
         Returns:
-            Hex formatında anahtar
+            KeystreamIndex instance
         """
-        key_bytes = self.generate_bytes(length)
-        return key_bytes.hex()
+        interval = interval or self.INDEX_INTERVAL
+        if interval <= 0:
+            raise ValueError("Aralık pozitif olmalıdır")
+        rsu = CollatzChaosRSU(self.seed, lfsr_table=self.lfsr.table,
+                              logistic_cache=self.logistic.cache,
+                              extractor=self.extractor, peres_depth=self.peres_depth)
+        checkpoints = [rsu._get_state()]
+        for _ in range(total_bits // interval):
+            rsu._discard(interval)
+            checkpoints.append(rsu._get_state())
+        return KeystreamIndex(self.seed, self.extractor, self.peres_depth,
+                              interval, checkpoints)
+    
+    def seek(self, bit_offset: int, index: Optional['KeystreamIndex'] = None):
+        """
+        Akışı bit_offset. çıktı bitine konumlandırır.
+        
+        Von Neumann adımı yüzünden çıktı konumu ham konumdan
+        hesaplanamaz; bu yüzden en yakın başlangıç noktasından (indeksteki
+        kontrol noktası, mevcut konum veya akış başı) ileri üretilir.
+        İndeksle en fazla interval bit üretilir. Sayaçlar akış baştan
+        sırayla okunmuş gibi güncellenir.
+        
+        Args:
+            bit_offset: Hedef çıktı biti
+            index: Bu üretecin akışı için build_index ile kurulmuş indeks
+        """
+        if bit_offset < 0:
+            raise ValueError("Konum negatif olamaz")
+        state = None
+        if index is not None:
+            if (index.seed, index.extractor, index.peres_depth) != \
+                    (self.seed, self.extractor, self.peres_depth):
+                raise ValueError("İndeks bu üretecin akışına ait değil")
+            checkpoint = index.checkpoint(bit_offset)
+            if not checkpoint[6] <= self._total <= bit_offset:
+                state = checkpoint
+        elif self._total > bit_offset:
+            state = self._initial_state()
+        
+        if state is not None:
+            self._set_state(state)
+        else:
+            self._entropy = 0
+            self._entropy_bits = 0
+        self._discard(bit_offset - self._total)
+    
+    def tell(self) -> int:
+        """Sonraki çıktı bitinin konumunu döndürür."""
+        return self._total
     
     def get_statistics(self) -> dict:
         """
         Üretilen bitlerin istatistiklerini döndürür.
         
+        Değerler oluşturulduğundan beri tutulan sayaçlardan O(1) okunur.
+        
         Returns:
             İstatistik sözlüğü
         """
-        if not self.generated_bits:
+        total = self._total
+        if not total:
             return {}
         
-        ones = sum(self.generated_bits)
-        zeros = len(self.generated_bits) - ones
-        total = len(self.generated_bits)
+        ones = self._ones
+        zeros = total - ones
+        produced = self._extracted_total
+        raw = self._raw_total
         
         return {
             'total_bits': total,
@@ -382,81 +2315,717 @@ class CollatzChaosRSU:
             'zeros': zeros,
             'ones_ratio': ones / total if total > 0 else 0,
             'zeros_ratio': zeros / total if total > 0 else 0,
-            'balance': abs(ones - zeros) / total if total > 0 else 0
+            'balance': abs(ones - zeros) / total if total > 0 else 0,
+            'extractor': self.extractor,
+            'raw_bits': raw,
+            'extractor_yield': produced / raw if raw else 0,
+            'discard_rate': 1 - produced / raw if raw else 0,
+            'pending_bits': self._pending_bits
         }
 
 
+class KeystreamIndex:
+    """
+    CollatzChaosRSU akışı için kontrol noktası indeksi.
+    
+    Her interval çıktı bitinde üretecin durumunu (LFSR durumu, Logistic
+    x'i, ham konum, devreden bitler ve sayaçlar) tutar. seek() en yakın
+    kontrol noktasından devam ederek rastgele erişimi interval bitlik
+    üretime indirger. CollatzChaosRSU.build_index ile kurulur.
+    """
+    
+    def __init__(self, seed: int, extractor: str, peres_depth: int,
+                 interval: int, checkpoints: List[tuple]):
+        """
+        Args:
+            seed: Üretecin tohumu
+            extractor: Çıkarıcı kipi
+            peres_depth: Peres yineleme derinliği
+            interval: Kontrol noktası aralığı (bit)
+            checkpoints: 0, interval, 2*interval... bitlerindeki durumlar
+        """
+        self.seed = seed
+        self.extractor = extractor
+        self.peres_depth = peres_depth
+        self.interval = interval
+        self.checkpoints = checkpoints
+    
+    def __len__(self) -> int:
+        return len(self.checkpoints)
+    
+    @property
+    def covered_bits(self) -> int:
+        """Son kontrol noktasının çıktı konumu."""
+        return (len(self.checkpoints) - 1) * self.interval
+    
+    def checkpoint(self, bit_offset: int) -> tuple:
+        """bit_offset'e eşit veya ondan önceki en yakın kontrol noktası."""
+        slot = min(bit_offset // self.interval, len(self.checkpoints) - 1)
+        return self.checkpoints[slot]
+
+
+# ==================== COLLATZ ARALIK TARAMASI ====================
+
+_SIEVE_CACHE: dict = {}
+_SMALL_CACHE: dict = {}
+
+
+def _collatz_sieve(k: int) -> list:
+    """
+    k bitlik kalıntı sınıfları için iniş kayıtlarını üretir.
+    
+    n = 2^k * a + b için yörünge simgesel olarak alpha * a + beta
+    biçiminde izlenir. Parite beta'dan okunabildiği sürece (k'dan az
+    bölme) ve değer her a >= 1 için n'nin altına düştüğü anda sınıf
+    kaydedilir: (adım, alpha, beta, tepeler). Tepeler 3n+1 sonrası
+    değerlerdir ve en büyük değer bunlardan biridir.
+    """
+    records = _SIEVE_CACHE.get(k)
+    if records is not None:
+        return records
+    limit = 1 << k
+    records = [None] * limit
+    for b in range(limit):
+        alpha, beta = limit, b
+        steps = 0
+        halvings = 0
+        peaks = []
+        while halvings < k:
+            steps += 1
+            if beta & 1:
+                alpha, beta = 3 * alpha, 3 * beta + 1
+                peaks.append((alpha, beta))
+            else:
+                alpha >>= 1
+                beta >>= 1
+                halvings += 1
+                if alpha < limit and limit - alpha > beta - b:
+                    records[b] = (steps, alpha, beta, tuple(peaks))
+                    break
+    _SIEVE_CACHE[k] = records
+    return records
+
+
+def _sweep_chunk(lo: int, hi: int, prefix_bits: int, sieve_k: int,
+                 small_limit: int) -> Tuple[array, list, array]:
+    """
+    [lo, hi) aralığındaki tohumlar için durma süresi, en büyük değer ve
+    parite önekini hesaplar (süreç havuzunda çalışabilir).
+    """
+    small = None
+    if small_limit > 1 and lo >= small_limit:
+        small = _SMALL_CACHE.get(small_limit)
+        if small is None:
+            steps, peaks, _ = _sweep_chunk(1, small_limit, 0, sieve_k, 0)
+            small = _SMALL_CACHE[small_limit] = (steps, peaks)
+    small_steps, small_peaks = small if small else ((), ())
+    small_end = len(small_steps) + 1  # small_steps[0] -> tohum 1
+    
+    count = hi - lo
+    stopping_times = array('I', [0]) * count
+    max_excursions = [0] * count
+    prefixes = array('Q', [0]) * count
+    
+    sieve = _collatz_sieve(sieve_k)
+    mask = (1 << sieve_k) - 1
+    for n in range(lo, hi):
+        # Parite öneki (get_seed_from_bits ile aynı bit sırası)
+        v = n
+        prefix = 0
+        for i in range(prefix_bits):
+            prefix |= (v & 1) << i
+            if v == 1:
+                break
+            v = 3 * v + 1 if v & 1 else v >> 1
+        prefixes[n - lo] = prefix
+        
+        v = n
+        total = 0
+        peak = n
+        if n > mask:
+            record = sieve[n & mask]
+            if record is not None:
+                # Bilinen iniş sınıfı: bloğu tek seferde atla
+                steps, alpha, beta, peaks = record
+                a = n >> sieve_k
+                for peak_alpha, peak_beta in peaks:
+                    value = peak_alpha * a + peak_beta
+                    if value > peak:
+                        peak = value
+                v = alpha * a + beta
+                total = steps
+        
+        while True:
+            if v < n:
+                # Daha küçük bir değere inildi: hafızadan tamamla
+                if v >= lo:
+                    total += stopping_times[v - lo]
+                    if max_excursions[v - lo] > peak:
+                        peak = max_excursions[v - lo]
+                    break
+                if v < small_end:
+                    total += small_steps[v - 1]
+                    if small_peaks[v - 1] > peak:
+                        peak = small_peaks[v - 1]
+                    break
+            if v == 1:
+                break
+            if v & 1:
+                v = 3 * v + 1
+                total += 1
+                if v > peak:
+                    peak = v
+            else:
+                zeros = (v & -v).bit_length() - 1
+                v >>= zeros
+                total += zeros
+        
+        stopping_times[n - lo] = total
+        max_excursions[n - lo] = peak
+    return stopping_times, max_excursions, prefixes
+
+
+def _compact(values: list):
+    """Değerler sığıyorsa array('Q') döndürür, aksi halde listeyi."""
+    try:
+        return array('Q', values)
+    except OverflowError:
+        return values
+
+
+def collatz_sweep(start: int, stop: int, prefix_bits: int = 16,
+                  workers: Optional[int] = None, chunk_size: int = 1 << 16,
+                  sieve_k: int = 10, small_limit: int = 1 << 16) -> dict:
+    """
+    [start, stop) aralığındaki tüm tohumları tarar.
+    
+    Her parça kendi aralığındaki durma sürelerini hafızada tutar; bir
+    yörünge tohumunun altına indiğinde sonuç hafızadan tamamlanır.
+    İndiği bilinen kalıntı sınıfları (mod 2^sieve_k) tek adımda atlanır.
+    Küçük değerler (< small_limit) için süreç başına ortak bir tablo
+    kullanılır. Birden fazla parça varsa aralık süreç havuzuna bölünür.
+    
+    Args:
+        start: İlk tohum (pozitif)
+        stop: Son tohum (hariç)
+        prefix_bits: Kaydedilecek parite öneki uzunluğu (en fazla 64)
+        workers: Süreç sayısı (None: CPU sayısı, 1: aynı süreçte)
+        chunk_size: Parça başına tohum sayısı
+        sieve_k: Kalıntı eleği bit sayısı
+        small_limit: Ortak küçük değer tablosunun sınırı
+        
+    Returns:
+        'stopping_times' (array('I')), 'max_excursions' (array('Q') veya
+        sığmazsa liste) ve 'prefixes' (array('Q')) içeren sözlük
+    """
+    if start <= 0:
+        raise ValueError("Seed pozitif bir tam sayı olmalıdır")
+    if not 0 <= prefix_bits <= 64:
+        raise ValueError("prefix_bits 0-64 arasında olmalıdır")
+    
+    bounds = [(lo, min(lo + chunk_size, stop)) for lo in range(start, stop, chunk_size)]
+    args = [(lo, hi, prefix_bits, sieve_k, small_limit) for lo, hi in bounds]
+    if workers == 1 or len(bounds) <= 1:
+        results = [_sweep_chunk(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_sweep_chunk, *zip(*args)))
+    
+    stopping_times = array('I')
+    max_excursions: list = []
+    prefixes = array('Q')
+    for steps, peaks, prefix in results:
+        stopping_times.extend(steps)
+        max_excursions.extend(peaks)
+        prefixes.extend(prefix)
+    
+    return {
+        'start': start,
+        'stop': stop,
+        'prefix_bits': prefix_bits,
+        'stopping_times': stopping_times,
+        'max_excursions': _compact(max_excursions),
+        'prefixes': prefixes
+    }
+
+
+# ==================== PARALEL ALT AKIŞLAR ====================
+
+def _substream_block(seed: int, index: int, size: int, extractor: str,
+                     peres_depth: int) -> bytes:
+    """index numaralı alt akışın ilk size byte'ını üretir (süreç havuzunda)."""
+    rsu = CollatzChaosRSU.substream(seed, index, extractor=extractor,
+                                    peres_depth=peres_depth)
+    return rsu.generate_bytes(size)
+
+
+def generate_parallel(seed: int, size: int, block_size: int = 1 << 20,
+                      workers: Optional[int] = None,
+                      extractor: str = VonNeumannExtractor.CLASSIC,
+                      peres_depth: int = VonNeumannExtractor.PERES_DEPTH) -> bytes:
+    """
+    Tek tohumdan birden çok çekirdekte size byte üretir.
+    
+    Çıktı block_size'lık bloklara bölünür; i. blok ana tohumdan türetilen
+    i. alt akışın (CollatzChaosRSU.substream) ilk byte'larıdır. Bloklar
+    süreç havuzunda üretilip sırayla birleştirilir. Blok ile alt akış
+    eşlemesi süreç sayısına bağlı olmadığından çıktı her workers değeri
+    için aynıdır (block_size ise çıktının parçasıdır).
+    
+    Args:
+        seed: Ana tohum (pozitif)
+        size: Üretilecek byte sayısı
+        block_size: Alt akış başına byte sayısı
+        workers: Süreç sayısı (None: CPU sayısı, 1: aynı süreçte)
+        extractor: Alt akışların çıkarıcı kipi
+        peres_depth: Peres kipinde yineleme derinliği
+        
+    Returns:
+        size byte'lık çıktı
+    """
+    if size < 0:
+        raise ValueError("Boyut negatif olamaz")
+    if block_size <= 0:
+        raise ValueError("Blok boyutu pozitif olmalıdır")
+    # Türetme ana tohumu doğrular
+    CollatzChaosRSU.substream_seed(seed, 0)
+    
+    sizes = [min(block_size, size - start) for start in range(0, size, block_size)]
+    count = len(sizes)
+    args = (
+        [seed] * count, range(count), sizes,
+        [extractor] * count, [peres_depth] * count
+    )
+    if workers == 1 or count <= 1:
+        blocks = map(_substream_block, *args)
+        return b''.join(blocks)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return b''.join(pool.map(_substream_block, *args))
+
+
+# ==================== İŞ PARÇACIĞI HAVUZU ====================
+
+class CollatzRSUPool:
+    """
+    Çok iş parçacıklı sunucular için üreteç havuzu.
+    
+    CollatzChaosRSU örneği değişken durum taşır (lfsr.state, logistic.x,
+    devreden bitler) ve kilitsiz paylaşılamaz. Havuz her iş parçacığına
+    ilk erişimde ana tohumun ayrı bir alt akışını
+    (CollatzChaosRSU.substream) verir; üretim sırasında kilit alınmaz.
+    Yalnızca alt akış numarası dağıtılırken kısa bir kilit kullanılır,
+    bu yüzden GIL'siz (free-threaded) yorumlayıcılarda iş parçacığı
+    sayısıyla ölçeklenir.
+    
+    Hangi iş parçacığının hangi alt akışı alacağı ilk erişim sırasına
+    bağlıdır; alt akışların kendisi tohumdan belirlenir.
+    """
+    
+    def __init__(self, seed: int, **kwargs):
+        """
+        Args:
+            seed: Ana tohum (pozitif)
+            **kwargs: Her alt akış üretecine aktarılan parametreler
+                (ör. lfsr_table=LFSRKeystreamTable.shared())
+        """
+        # Türetme ana tohumu doğrular
+        CollatzChaosRSU.substream_seed(seed, 0)
+        self.seed = seed
+        self.kwargs = kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._next_index = 0
+    
+    @property
+    def created(self) -> int:
+        """Şimdiye kadar dağıtılan alt akış sayısı."""
+        return self._next_index
+    
+    def get(self) -> CollatzChaosRSU:
+        """Çağıran iş parçacığının kendi üretecini döndürür."""
+        rsu = getattr(self._local, 'rsu', None)
+        if rsu is None:
+            with self._lock:
+                index = self._next_index
+                self._next_index += 1
+            rsu = CollatzChaosRSU.substream(self.seed, index, **self.kwargs)
+            self._local.rsu = rsu
+        return rsu
+    
+    def read(self, size: int) -> bytes:
+        """İş parçacığının alt akışından size byte okur."""
+        return self.get().read(size)
+    
+    def readinto(self, buffer) -> int:
+        """Tamponu iş parçacığının alt akışından doldurur."""
+        return self.get().readinto(buffer)
+    
+    def randbelow(self, n: int) -> int:
+        """İş parçacığının alt akışından [0, n) aralığında tamsayı çeker."""
+        return self.get().randbelow(n)
+
+
+# ==================== PAYLAŞIMLI BELLEK HALKA TAMPONU ====================
+
+def _attach_shared_memory(name: str):
+    """Var olan paylaşımlı bellek bloğuna bağlanır (kaynak izleyicisiz)."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13: track parametresi yok
+        return shared_memory.SharedMemory(name=name)
+
+
+def _ring_producer(name: str, capacity: int, chunk: int, seed: int, kwargs: dict,
+                   not_empty, not_full, stop, failed):
+    """
+    Halka tamponu arka plan sürecinde doldurur.
+    
+    Boş yer chunk'a ulaşana kadar bekler, parçayı kilit dışında doğrudan
+    halkaya üretir ve ardından yazma konumunu ilerletip tüketicileri
+    uyandırır. Tüketiciler yalnızca [okuma, yazma) aralığına
+    dokunduğundan üretilen bölge kilitsiz yazılabilir.
+    
+    Bir hata oluşursa failed işaretlenir ve bekleyen tüketiciler
+    uyandırılır; böylece tüketiciler sonsuza dek beklemez.
+    """
+    shm = _attach_shared_memory(name)
+    header = SharedKeystreamBuffer._HEADER
+    data = shm.buf[header.size:header.size + capacity]
+    try:
+        rsu = CollatzChaosRSU(seed, **kwargs)
+        while not stop.is_set():
+            with not_full:
+                write, read = header.unpack_from(shm.buf)
+                if capacity - (write - read) < chunk:
+                    not_full.wait(0.1)
+                    continue
+            start = write % capacity
+            first = min(chunk, capacity - start)
+            rsu.readinto(data[start:start + first])
+            if first < chunk:
+                rsu.readinto(data[:chunk - first])
+            with not_empty:
+                read = header.unpack_from(shm.buf)[1]
+                header.pack_into(shm.buf, 0, write + chunk, read)
+                not_empty.notify_all()
+    except BaseException:
+        failed.set()
+        with not_empty:
+            not_empty.notify_all()
+        raise
+    finally:
+        data.release()
+        shm.close()
+
+
+class SharedKeystreamBuffer:
+    """
+    Süreçler arası paylaşılan anahtar akışı halka tamponu.
+    
+    Bir üretici süreç tek bir CollatzChaosRSU akışını
+    multiprocessing.shared_memory üzerindeki halkaya talepten önce
+    doldurur. Tüketici süreçler nesneyi argüman olarak alır (Process
+    args, Pool initializer) ve take() ile byte çeker; böylece hiçbir
+    tüketici kendi üretecini kurmaz. Her byte tam olarak bir tüketiciye
+    akış sırasıyla verilir.
+    
+    Bellek başlığı iki sayaç tutar (toplam yazılan ve toplam okunan
+    byte); eşzamanlama tek bir kilit ve ona bağlı iki koşul ile yapılır.
+    
+    multiprocessing.shared_memory gerektirir (Python 3.8+). 'spawn'
+    başlatma kipinde kwargs seçilebilir (pickle edilebilir) olmalıdır.
+    """
+    
+    # Paylaşımlı bellek başlığı: toplam yazılan, toplam okunan byte
+    _HEADER = struct.Struct('<QQ')
+    
+    def __init__(self, seed: int, capacity: int = 1 << 20, chunk: int = 1 << 14,
+                 **kwargs):
+        """
+        Args:
+            seed: Akış tohumu
+            capacity: Halka boyutu (byte)
+            chunk: Üreticinin tek seferde yazdığı byte sayısı
+            **kwargs: Üretici CollatzChaosRSU'ya aktarılan parametreler
+        """
+        if shared_memory is None:
+            raise ImportError("multiprocessing.shared_memory gereklidir (Python 3.8+)")
+        if not 0 < chunk <= capacity:
+            raise ValueError("chunk 0 ile capacity arasında olmalıdır")
+        # Tohum ve kwargs üreticide geç kullanıldığından burada doğrulanır
+        CollatzChaosRSU(seed, **kwargs)
+        self.seed = seed
+        self.capacity = capacity
+        self.chunk = chunk
+        self.kwargs = kwargs
+        
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._HEADER.size + capacity)
+        self._HEADER.pack_into(self._shm.buf, 0, 0, 0)
+        # fork ile kopyalanan tüketiciler sahip sayılmaz
+        self._owner_pid = os.getpid()
+        
+        lock = multiprocessing.Lock()
+        self._not_empty = multiprocessing.Condition(lock)
+        self._not_full = multiprocessing.Condition(lock)
+        self._stop = multiprocessing.Event()
+        self._failed = multiprocessing.Event()
+        self._producer = None
+    
+    def __getstate__(self) -> dict:
+        """Tüketici süreçlere aktarım: bellek adı ve eşzamanlama nesneleri."""
+        state = self.__dict__.copy()
+        state['_shm'] = self._shm.name
+        state['_owner_pid'] = None
+        state['_producer'] = None
+        return state
+    
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._shm = _attach_shared_memory(state['_shm'])
+    
+    @property
+    def _owner(self) -> bool:
+        """Bu süreç tamponu oluşturan (ve silecek olan) süreç mi?"""
+        return self._owner_pid == os.getpid()
+    
+    @property
+    def name(self) -> str:
+        """Paylaşımlı bellek bloğunun adı."""
+        return self._shm.name
+    
+    @property
+    def available(self) -> int:
+        """Halkada hazır bekleyen byte sayısı."""
+        with self._not_empty:
+            write, read = self._HEADER.unpack_from(self._shm.buf)
+        return write - read
+    
+    def start(self) -> 'SharedKeystreamBuffer':
+        """Üretici süreci başlatır (yalnızca sahip süreçte)."""
+        if not self._owner:
+            raise RuntimeError("Üretici yalnızca tamponu oluşturan süreçte başlatılabilir")
+        if self._producer is None:
+            self._producer = multiprocessing.Process(
+                target=_ring_producer,
+                args=(self._shm.name, self.capacity, self.chunk, self.seed,
+                      self.kwargs, self._not_empty, self._not_full, self._stop,
+                      self._failed),
+                daemon=True)
+            self._producer.start()
+        return self
+    
+    def take_into(self, buffer, timeout: Optional[float] = None) -> int:
+        """
+        Tamponu halkadan alınan byte'larla doldurur.
+        
+        Halkada yeterli veri yoksa üreticiyi bekler. capacity - chunk + 1
+        byte'ı aşmayan istekler akışın bitişik bir dilimini alır; daha
+        büyük istekler bu boyutta parçalar halinde alınır. Üretici süreç
+        hata ile sonlanmışsa beklemek yerine RuntimeError yükseltilir.
+        
+        Args:
+            buffer: Yazılabilir tampon
+            timeout: Tek bekleme için en fazla süre (None: sınırsız)
+            
+        Returns:
+            Yazılan byte sayısı
+        """
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        total = len(view)
+        header = self._HEADER
+        capacity = self.capacity
+        # Üretici tam parçalar yazdığından halkada en az bu kadar veri
+        # birikmesi garantidir
+        span = capacity - self.chunk + 1
+        base = header.size
+        buf = self._shm.buf
+        
+        done = 0
+        while done < total:
+            with self._not_empty:
+                size = min(total - done, span)
+                write, read = header.unpack_from(buf)
+                while write - read < size:
+                    if self._failed.is_set():
+                        raise RuntimeError("Halka tamponun üretici süreci başarısız oldu")
+                    if not self._not_empty.wait(timeout):
+                        raise TimeoutError("Halka tamponda yeterli veri yok")
+                    write, read = header.unpack_from(buf)
+                
+                start = read % capacity
+                first = min(size, capacity - start)
+                view[done:done + first] = buf[base + start:base + start + first]
+                if first < size:
+                    view[done + first:done + size] = buf[base:base + size - first]
+                header.pack_into(buf, 0, write, read + size)
+                self._not_full.notify()
+            done += size
+        return total
+    
+    def take(self, size: int, timeout: Optional[float] = None) -> bytes:
+        """
+        Halkadan size byte alır.
+        
+        Args:
+            size: Alınacak byte sayısı
+            timeout: Tek bekleme için en fazla süre (None: sınırsız)
+            
+        Returns:
+            Byte dizisi
+        """
+        result = bytearray(size)
+        self.take_into(result, timeout)
+        return bytes(result)
+    
+    def close(self):
+        """
+        Üreticiyi durdurur ve belleği bırakır; sahip süreçte blok silinir.
+        """
+        owner = self._owner
+        if owner and self._producer is not None:
+            self._stop.set()
+            with self._not_full:
+                self._not_full.notify_all()
+            self._producer.join()
+            self._producer = None
+        self._shm.close()
+        if owner:
+            self._shm.unlink()
+            self._owner_pid = None
+    
+    def __enter__(self) -> 'SharedKeystreamBuffer':
+        return self.start() if self._owner else self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
 # ==================== ŞİFRELEME FONKSİYONLARI ====================
 
+# bits_to_hex her byte'ın düşük nibble'ını önce yazar; bytes.hex() ile
+# arasındaki dönüşüm nibble'ların yer değiştirmesidir
+_NIBBLE_SWAP = bytes(((b & 0x0F) << 4) | (b >> 4) for b in range(256))
+
+
 def text_to_bits(text: str) -> List[int]:
     """Metni bit dizisine dönüştürür."""
-    bits = []
-    for char in text.encode('utf-8'):
-        for i in range(8):
-            bits.append((char >> i) & 1)
-    return bits
+    data = text.encode('utf-8')
+    return unpack_bits(data, len(data) * 8)
 
 
 def bits_to_text(bits: List[int]) -> str:
     """Bit dizisini metne dönüştürür."""
-    chars = []
-    for i in range(0, len(bits), 8):
-        byte_bits = bits[i:i + 8]
-        if len(byte_bits) == 8:
-            byte_val = sum(bit << j for j, bit in enumerate(byte_bits))
-            chars.append(byte_val)
-    return bytes(chars).decode('utf-8', errors='replace')
+    # Eksik kalan son byte atlanır
+    data = pack_bits(bits[:len(bits) // 8 * 8])
+    return data.decode('utf-8', errors='replace')
+
+
+def bytes_to_hex(data: bytes) -> str:
+    """Byte'ları bu modülün hex biçimine (düşük nibble önce) dönüştürür."""
+    return binascii.hexlify(data.translate(_NIBBLE_SWAP)).decode('ascii')
+
+
+def hex_to_bytes(hex_str: str) -> bytes:
+    """bytes_to_hex'in tersi; tek kalan son karakter yok sayılır."""
+    return binascii.unhexlify(hex_str[:len(hex_str) // 2 * 2]).translate(_NIBBLE_SWAP)
 
 
 def bits_to_hex(bits: List[int]) -> str:
     """Bit dizisini hex string'e dönüştürür."""
-    hex_str = ""
-    for i in range(0, len(bits), 4):
-        nibble = bits[i:i + 4]
-        if len(nibble) == 4:
-            val = sum(bit << j for j, bit in enumerate(nibble))
-            hex_str += format(val, 'x')
-    return hex_str
+    # Eksik kalan son nibble atlanır
+    nibbles = len(bits) // 4
+    return bytes_to_hex(pack_bits(bits[:nibbles * 4]))[:nibbles]
 
 
 def hex_to_bits(hex_str: str) -> List[int]:
     """Hex string'i bit dizisine dönüştürür."""
-    bits = []
-    for char in hex_str:
-        val = int(char, 16)
-        for i in range(4):
-            bits.append((val >> i) & 1)
-    return bits
+    padded = hex_str + '0' if len(hex_str) % 2 else hex_str
+    return unpack_bits(hex_to_bytes(padded), len(hex_str) * 4)
 
 
-def encrypt(message: str, seed: int) -> Tuple[str, str]:
+def decrypt_range(encrypted_hex: str, seed: int, start: int, end: int,
+                  index: Optional[KeystreamIndex] = None) -> bytes:
     """
-    Mesajı şifreler.
+    Şifreli mesajın yalnızca [start, end) byte aralığını çözer.
+    
+    Anahtar akışı baştan üretilmez; seek() ile start * 8. bite
+    konumlanılır (index verilirse en yakın kontrol noktasından).
+    Aralık çok byte'lı bir UTF-8 karakterini bölebileceğinden sonuç
+    byte olarak döner.
     
     Args:
-        message: Şifrelenecek mesaj
+        encrypted_hex: encrypt() çıktısı (hex formatında)
         seed: Şifreleme anahtarı (tohum)
+        start: İlk byte (dahil)
+        end: Son byte (hariç; mesaj sonunda kırpılır)
+        index: İsteğe bağlı kontrol noktası indeksi
         
     Returns:
-        (şifreli_mesaj_hex, anahtar_hex) tuple'ı
+        Çözülmüş byte'lar
     """
-    # RSÜ oluştur
+    end = min(end, len(encrypted_hex) // 2)
+    if not 0 <= start <= end:
+        raise ValueError("Geçersiz aralık: [{}, {})".format(start, end))
+    
     rsu = CollatzChaosRSU(seed)
+    rsu.seek(start * 8, index)
+    key = rsu.generate_balanced_packed((end - start) * 8)
     
-    # Mesajı bitlere dönüştür
-    message_bits = text_to_bits(message)
+    data = hex_to_bytes(encrypted_hex[2 * start:2 * end])
+    plain = int.from_bytes(data, 'little') ^ int.from_bytes(key, 'little')
+    return plain.to_bytes(end - start, 'little')
+
+
+def encrypt_bytes(data: bytes, seed: int) -> bytes:
+    """
+    Byte dizisini şifreler.
     
-    # Anahtar üret
-    key_bits = rsu.generate_balanced_bits(len(message_bits))
+    Anahtar akışı paketli üretilir ve mesajla tek bir büyük tamsayı
+    XOR'uyla birleştirilir; bit listesi oluşturulmaz.
     
-    # XOR şifreleme
-    encrypted_bits = [m ^ k for m, k in zip(message_bits, key_bits)]
+    Args:
+        data: Şifrelenecek byte'lar
+        seed: Şifreleme anahtarı (tohum)
+        
+    Returns:
+        Şifreli byte'lar (data ile aynı uzunlukta)
+    """
+    key = CollatzChaosRSU(seed).generate_bytes(len(data))
+    return xor_packed(data, key)
+
+
+def decrypt_bytes(data: bytes, seed: int) -> bytes:
+    """
+    encrypt_bytes ile şifrelenmiş byte dizisini çözer (XOR kendi tersi).
     
-    # Hex'e dönüştür
-    encrypted_hex = bits_to_hex(encrypted_bits)
-    key_hex = bits_to_hex(key_bits)
+    Args:
+        data: Şifreli byte'lar
+        seed: Şifreleme anahtarı (tohum)
+        
+    Returns:
+        Çözülmüş byte'lar
+    """
+    return encrypt_bytes(data, seed)
+
+
+def encrypt(message: str, seed: int) -> Tuple[str, str]:
+    """
+    Mesajı şifreler.
     
-    return encrypted_hex, key_hex
+    Args:
+        message: Şifrelenecek mesaj
+        seed: Şifreleme anahtarı (tohum)
+        
+    Returns:
+        (şifreli_mesaj_hex, anahtar_hex) tuple'ı
+    """
+    data = message.encode('utf-8')
+    key = CollatzChaosRSU(seed).generate_bytes(len(data))
+    return bytes_to_hex(xor_packed(data, key)), bytes_to_hex(key)
 
 
 def decrypt(encrypted_hex: str, seed: int) -> str:
@@ -470,20 +3039,98 @@ def decrypt(encrypted_hex: str, seed: int) -> str:
     Returns:
         Çözülmüş mesaj
     """
-    # RSÜ oluştur (aynı seed ile)
-    rsu = CollatzChaosRSU(seed)
+    data = decrypt_bytes(hex_to_bytes(encrypted_hex), seed)
+    return data.decode('utf-8', errors='replace')
+
+
+def _iter_source(src, chunk_size: int) -> Generator[memoryview, None, None]:
+    """
+    Kaynağı chunk_size'lık parçalar halinde verir.
+    
+    Normal dosyalar mmap ile kopyasız dilimlenir; diğer dosya nesneleri
+    (boru, soket, BytesIO) tek bir yeniden kullanılan tamponla okunur.
+    """
+    try:
+        fileno = src.fileno()
+        size = os.fstat(fileno).st_size - src.tell()
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) if size > 0 else None
+    except (AttributeError, OSError, ValueError):
+        mapped = None
+    
+    if mapped is not None:
+        offset = src.tell()
+        view = memoryview(mapped)
+        try:
+            for start in range(offset, len(mapped), chunk_size):
+                # Dilim tüketici bir sonrakini istediğinde bırakılır
+                with view[start:start + chunk_size] as chunk:
+                    yield chunk
+            src.seek(len(mapped))
+        finally:
+            view.release()
+            mapped.close()
+        return
     
-    # Şifreli mesajı bitlere dönüştür
-    encrypted_bits = hex_to_bits(encrypted_hex)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    readinto = getattr(src, 'readinto', None)
+    while True:
+        if readinto is not None:
+            count = readinto(buffer)
+        else:
+            data = src.read(chunk_size)
+            count = len(data)
+            buffer[:count] = data
+        if not count:
+            break
+        yield view[:count]
+
+
+def encrypt_stream(src, dst, seed: int, chunk_size: int = 1 << 16) -> int:
+    """
+    Dosya nesnesini parça parça şifreleyip hedefe yazar.
     
-    # Anahtar üret (aynı seed aynı anahtarı üretir)
-    key_bits = rsu.generate_balanced_bits(len(encrypted_bits))
+    Tek bir CollatzChaosRSU'dan parça boyutunda anahtar akışı çekilir;
+    bellek kullanımı girdi boyutundan bağımsızdır. Çıktı encrypt_bytes
+    ile aynıdır.
     
-    # XOR deşifreleme (XOR kendi tersi)
-    decrypted_bits = [e ^ k for e, k in zip(encrypted_bits, key_bits)]
+    Args:
+        src: Okunabilir ikili dosya nesnesi (normal dosyalar mmap'lenir)
+        dst: Yazılabilir ikili dosya nesnesi
+        seed: Şifreleme anahtarı (tohum)
+        chunk_size: Parça boyutu (byte)
+        
+    Returns:
+        İşlenen byte sayısı
+    """
+    if chunk_size <= 0:
+        raise ValueError("Parça boyutu pozitif olmalıdır")
+    rsu = CollatzChaosRSU(seed)
+    key = bytearray(chunk_size)
+    key_view = memoryview(key)
+    total = 0
+    for chunk in _iter_source(src, chunk_size):
+        count = len(chunk)
+        rsu.readinto(key_view[:count])
+        dst.write(xor_packed(chunk, key_view[:count]))
+        total += count
+    return total
+
+
+def decrypt_stream(src, dst, seed: int, chunk_size: int = 1 << 16) -> int:
+    """
+    encrypt_stream ile şifrelenmiş akışı çözer (XOR kendi tersi).
     
-    # Metne dönüştür
-    return bits_to_text(decrypted_bits)
+    Args:
+        src: Okunabilir ikili dosya nesnesi
+        dst: Yazılabilir ikili dosya nesnesi
+        seed: Şifreleme anahtarı (tohum)
+        chunk_size: Parça boyutu (byte)
+        
+    Returns:
+        İşlenen byte sayısı
+    """
+    return encrypt_stream(src, dst, seed, chunk_size)
 
 
 # ==================== TEST FONKSİYONLARI ====================
@@ -532,5 +3179,57 @@ def demo():
     print("\n" + "=" * 60)
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Komut satırı girişi.
+    
+    Argümansız çağrıldığında demo() çalışır; aksi halde
+    encrypt|decrypt TOHUM [GİRDİ] [ÇIKTI] ile dosya şifreler. '-' veya
+    verilmeyen yollar stdin/stdout demektir. Hız stderr'e yazılır.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        demo()
+        return 0
+    
+    parser = argparse.ArgumentParser(
+        prog='python -m collatz_rsu',
+        description='Collatz-Fibonacci-Chaos RSÜ ile dosya şifreleme')
+    parser.add_argument('command', choices=['encrypt', 'decrypt'])
+    parser.add_argument('seed', type=int, help='Şifreleme anahtarı (tohum)')
+    parser.add_argument('input', nargs='?', default='-', help='Girdi dosyası')
+    parser.add_argument('output', nargs='?', default='-', help='Çıktı dosyası')
+    parser.add_argument('--chunk-size', type=int, default=1 << 16,
+                        help='Parça boyutu (byte)')
+    args = parser.parse_args(argv)
+    
+    # Çıktı dosyası kesilmeden önce tohumu doğrula
+    try:
+        CollatzGenerator.lfsr_seed_for(args.seed)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.chunk_size <= 0:
+        parser.error("Parça boyutu pozitif olmalıdır")
+    
+    process = encrypt_stream if args.command == 'encrypt' else decrypt_stream
+    src = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    dst = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    try:
+        start = time.perf_counter()
+        total = process(src, dst, args.seed, args.chunk_size)
+        dst.flush()
+        elapsed = time.perf_counter() - start
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+    
+    rate = total / elapsed / (1 << 20) if elapsed > 0 else 0.0
+    print("{}: {} byte, {:.3f} s, {:.3f} MB/s".format(
+        args.command, total, elapsed, rate), file=sys.stderr)
+    return 0
+
+
 if __name__ == "__main__":
-    demo()
+    raise SystemExit(main())
@@ -0,0 +1,395 @@
+"""
+Collatz-Fibonacci-Chaos RSÜ Anahtar Sunucusu
+============================================
+Bu modül, sıcak tutulan CollatzChaosRSU örneklerinden yerel bir Unix
+soketi üzerinden byte ve anahtar dağıtan küçük bir asyncio sunucusu ile
+bağlantı havuzlu istemcisini içerir.
+
+Protokol (little-endian):
+    İstek : op (B), istek_no (I), tohum (Q), oturum (I), uzunluk (I)
+    Yanıt : durum (B), istek_no (I), uzunluk (I), ardından uzunluk byte
+
+    op 1 = generate_bytes, op 2 = generate_key (ASCII hex yanıt)
+    durum 0 = başarılı, 1 = hata (yanıt UTF-8 hata mesajıdır)
+
+Oturum 0 tohumun ortak akışını, diğer oturumlar ise
+CollatzChaosRSU.substream(tohum, oturum) alt akışlarını kullanır.
+
+Kullanım:
+    python collatz_server.py /tmp/collatz.sock
+
+Yazar: [İsminizi Yazın]
+Tarih: Ocak 2026
+"""
+
+import sys
+import asyncio
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from collatz_rsu import CollatzChaosRSU, LFSRKeystreamTable
+
+
+REQUEST = struct.Struct('<BIQII')
+RESPONSE = struct.Struct('<BII')
+
+OP_BYTES = 1
+OP_KEY = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+class _Request:
+    """Sunucuda yanıt bekleyen tek bir istek."""
+
+    __slots__ = ('writer', 'slots', 'seed', 'session', 'length', 'op',
+                 'request_id', 'data')
+
+    def __init__(self, writer: asyncio.StreamWriter, slots: asyncio.Semaphore,
+                 seed: int, session: int, length: int, op: int, request_id: int):
+        self.writer = writer
+        self.slots = slots
+        self.seed = seed
+        self.session = session
+        self.length = length
+        self.op = op
+        self.request_id = request_id
+        self.data = bytearray()
+
+    @property
+    def missing(self) -> int:
+        """Henüz üretilmemiş byte sayısı."""
+        return self.length - len(self.data)
+
+    def respond(self, status: int, payload: bytes):
+        """Yanıtı yazar ve bağlantının istek yuvasını bırakır."""
+        self.writer.write(RESPONSE.pack(status, self.request_id, len(payload)) + payload)
+        self.slots.release()
+
+
+class CollatzKeyServer:
+    """
+    Unix soketi üzerinden anahtar akışı sunan asyncio sunucusu.
+
+    Aynı olay döngüsü turunda gelen tüm istekler tek bir toplu işte
+    yanıtlanır: istekler (tohum, oturum) üretecine göre gruplanır ve her
+    üreteç için tek bir generate_bytes çağrısı yapılıp sırayla dilimlenir.
+    Bu, tek tek çağrılarla aynı akışı verir.
+
+    Üretim olay döngüsünde yapıldığından bir turda en fazla flush_bytes
+    byte üretilir. Sığmayan istekler kısmen üretilip sonraki tura
+    devredilir; gruplar bekleyen ilk isteği en küçük olandan başlayarak
+    işlendiğinden küçük anahtar istekleri büyük isteklerin arkasında
+    beklemez.
+
+    Geri basınç: her bağlantının yanıtlanmamış istek sayısı max_inflight
+    ile sınırlıdır ve yazma tamponu dolduğunda bağlantı okunmaz; böylece
+    yavaş istemciler soket akış denetimiyle yavaşlatılır.
+    """
+
+    def __init__(self, path: str, max_instances: int = 1024,
+                 max_request: int = 1 << 12, max_inflight: int = 256,
+                 flush_bytes: int = 1 << 10, use_table: bool = True):
+        """
+        Args:
+            path: Unix soket yolu
+            max_instances: Sıcak tutulacak en fazla üreteç sayısı (LRU)
+            max_request: Tek istekte en fazla byte
+            max_inflight: Bağlantı başına yanıtlanmamış en fazla istek
+            flush_bytes: Bir olay döngüsü turunda üretilecek en fazla byte
+            use_table: Üreteçler ortak LFSR tablosunu kullansın mı
+        """
+        if flush_bytes <= 0:
+            raise ValueError("flush_bytes pozitif olmalıdır")
+        self.path = path
+        self.max_instances = max_instances
+        self.max_request = max_request
+        self.max_inflight = max_inflight
+        self.flush_bytes = flush_bytes
+        self._table = LFSRKeystreamTable.shared() if use_table else None
+        self._instances: 'OrderedDict[Tuple[int, int], CollatzChaosRSU]' = OrderedDict()
+        self._batch: List[_Request] = []
+        self._flush_scheduled = False
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.served = 0
+
+    def _generator(self, seed: int, session: int) -> CollatzChaosRSU:
+        """(tohum, oturum) için sıcak üreteci döndürür (gerekirse kurar)."""
+        key = (seed, session)
+        rsu = self._instances.get(key)
+        if rsu is not None:
+            self._instances.move_to_end(key)
+            return rsu
+        if session:
+            rsu = CollatzChaosRSU.substream(seed, session, lfsr_table=self._table)
+        else:
+            rsu = CollatzChaosRSU(seed, lfsr_table=self._table)
+        self._instances[key] = rsu
+        if len(self._instances) > self.max_instances:
+            self._instances.popitem(last=False)
+        return rsu
+
+    def _flush(self):
+        """Bu turda biriken istekleri flush_bytes sınırı içinde yanıtlar."""
+        self._flush_scheduled = False
+        batch, self._batch = self._batch, []
+
+        groups: Dict[Tuple[int, int], List[_Request]] = {}
+        for item in batch:
+            groups.setdefault((item.seed, item.session), []).append(item)
+
+        budget = self.flush_bytes
+        deferred: List[_Request] = []
+        served = 0
+        for (seed, session), items in sorted(groups.items(),
+                                             key=lambda group: group[1][0].missing):
+            try:
+                rsu = self._generator(seed, session)
+            except ValueError as exc:
+                message = str(exc).encode('utf-8')
+                for item in items:
+                    item.respond(STATUS_ERROR, message)
+                served += len(items)
+                continue
+
+            # Akış sırasını korumak için istekler sırayla doldurulur
+            size = 0
+            for item in items:
+                size += item.missing
+                if size >= budget:
+                    break
+            size = min(size, budget)
+            data = rsu.generate_bytes(size) if size else b''
+            budget -= size
+
+            offset = 0
+            for index, item in enumerate(items):
+                take = min(item.missing, size - offset)
+                item.data += data[offset:offset + take]
+                offset += take
+                if item.missing:
+                    deferred.extend(items[index:])
+                    break
+                payload = bytes(item.data)
+                if item.op == OP_KEY:
+                    payload = payload.hex().encode('ascii')
+                item.respond(STATUS_OK, payload)
+                served += 1
+        self.served += served
+
+        # Kalan işi sonraki tura devret; akış sırası korunur
+        if deferred:
+            self._batch[:0] = deferred
+            self._schedule()
+
+    def _schedule(self):
+        """Toplu işin bu turun sonunda çalışmasını sağlar."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _submit(self, item: _Request):
+        """İsteği bu turun toplu işine ekler."""
+        self._batch.append(item)
+        self._schedule()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Tek bir bağlantının isteklerini okur."""
+        slots = asyncio.Semaphore(self.max_inflight)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+                op, request_id, seed, session, length = REQUEST.unpack(header)
+
+                error = None
+                if op not in (OP_BYTES, OP_KEY):
+                    error = "Bilinmeyen işlem: {}".format(op)
+                elif length > self.max_request:
+                    error = "İstek çok büyük: {} > {}".format(length, self.max_request)
+                if error is not None:
+                    message = error.encode('utf-8')
+                    writer.write(RESPONSE.pack(STATUS_ERROR, request_id, len(message)) + message)
+                else:
+                    await slots.acquire()
+                    self._submit(_Request(writer, slots, seed, session, length, op, request_id))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        """Sunucuyu başlatır."""
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def serve_forever(self):
+        """Sunucuyu başlatır ve kapatılana kadar çalıştırır."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Sunucuyu kapatır."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+class _Connection:
+    """İstemci tarafında çoğullanmış tek bir soket bağlantısı."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._task = asyncio.ensure_future(self._read_loop())
+
+    async def _read_loop(self):
+        """Yanıtları istek numarasına göre bekleyen çağrılara dağıtır."""
+        error: Exception = ConnectionError("Sunucu bağlantıyı kapattı")
+        try:
+            while True:
+                header = await self.reader.readexactly(RESPONSE.size)
+                status, request_id, length = RESPONSE.unpack(header)
+                payload = await self.reader.readexactly(length) if length else b''
+                future = self.pending.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if status == STATUS_OK:
+                    future.set_result(payload)
+                else:
+                    future.set_exception(ValueError(payload.decode('utf-8')))
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            if isinstance(exc, ConnectionError):
+                error = exc
+        except asyncio.CancelledError:
+            error = ConnectionError("Bağlantı kapatıldı")
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    @property
+    def closed(self) -> bool:
+        return self._task.done()
+
+    async def request(self, op: int, seed: int, session: int, length: int) -> bytes:
+        """Bir istek gönderir ve yanıtını bekler."""
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        self.writer.write(REQUEST.pack(op, request_id, seed, session, length))
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self._task.cancel()
+        self.writer.close()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class CollatzKeyClient:
+    """
+    CollatzKeyServer için bağlantı havuzlu asyncio istemcisi.
+
+    Her bağlantı birden çok isteği aynı anda taşır (istek numarasıyla
+    çoğullama). İstekler en az bekleyen isteği olan bağlantıya gider;
+    havuz pool_size bağlantıya kadar gerektikçe büyür.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4):
+        """
+        Args:
+            path: Sunucunun Unix soket yolu
+            pool_size: En fazla bağlantı sayısı
+        """
+        self.path = path
+        self.pool_size = pool_size
+        self._connections: List[_Connection] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _connection(self) -> _Connection:
+        """İsteğin gönderileceği bağlantıyı seçer (gerekirse açar)."""
+        self._connections = [c for c in self._connections if not c.closed]
+        best = min(self._connections, key=lambda c: len(c.pending), default=None)
+        if best is not None and (not best.pending or len(self._connections) >= self.pool_size):
+            return best
+
+        # Kilit olay döngüsü içinde kurulur (Python 3.7-3.9 uyumu)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._connections = [c for c in self._connections if not c.closed]
+            if len(self._connections) < self.pool_size:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+                self._connections.append(_Connection(reader, writer))
+            return min(self._connections, key=lambda c: len(c.pending))
+
+    async def generate_bytes(self, seed: int, count: int, session: int = 0) -> bytes:
+        """
+        Sunucudan rastgele byte'lar ister.
+
+        Args:
+            seed: Tohum (pozitif, 64 bit)
+            count: Byte sayısı
+            session: Oturum (0: tohumun ortak akışı)
+
+        Returns:
+            Byte dizisi
+        """
+        connection = await self._connection()
+        return await connection.request(OP_BYTES, seed, session, count)
+
+    async def generate_key(self, seed: int, length: int, session: int = 0) -> str:
+        """
+        Sunucudan hex formatında anahtar ister.
+
+        Args:
+            seed: Tohum (pozitif, 64 bit)
+            length: Anahtar uzunluğu (byte cinsinden)
+            session: Oturum (0: tohumun ortak akışı)
+
+        Returns:
+            Hex formatında anahtar
+        """
+        connection = await self._connection()
+        payload = await connection.request(OP_KEY, seed, session, length)
+        return payload.decode('ascii')
+
+    async def close(self):
+        """Tüm bağlantıları kapatır."""
+        connections, self._connections = self._connections, []
+        for connection in connections:
+            await connection.close()
+
+    async def __aenter__(self) -> 'CollatzKeyClient':
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def main(argv: List[str]):
+    """Sunucuyu komut satırından çalıştırır."""
+    path = argv[0] if argv else '/tmp/collatz_rsu.sock'
+    server = CollatzKeyServer(path)
+    print(f"🔑 Collatz-Fibonacci-Chaos RSÜ sunucusu: {path}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -14,7 +14,8 @@ from collatz_rsu import (
     CollatzChaosRSU,
     encrypt,
     decrypt,
-    VonNeumannExtractor
+    VonNeumannExtractor,
+    collatz_sweep
 )
 
 
@@ -104,6 +105,15 @@ def example_von_neumann():
     if balanced:
         print(f"   1 oranı: {sum(balanced)/len(balanced):.0%}")
     print(f"   Bit kaybı: {len(biased) - len(balanced)} bit")
+    
+    # Klasik ve Peres kiplerinin verimi (ham bit başına çıktı)
+    raw_count = 1 << 16
+    raw = CollatzChaosRSU(12345).generate_raw_packed(raw_count)
+    _, classic = VonNeumannExtractor.extract_packed(raw, raw_count)
+    _, peres = VonNeumannExtractor.extract_peres_packed(raw, raw_count)
+    print(f"\n   {raw_count} ham bit üzerinde verim:")
+    print(f"   Klasik Von Neumann: {classic / raw_count:.2%}")
+    print(f"   Peres (derinlik {VonNeumannExtractor.PERES_DEPTH}): {peres / raw_count:.2%}")
 
 
 def example_rsu():
@@ -197,6 +207,27 @@ def example_different_seeds():
         print(f"   {seed:<12} | {collatz_steps:<12} | {ones_ratio:<10.2%} | {first_bits}")
 
 
+def example_sweep():
+    """Aralık taraması örneği."""
+    print("\n" + "=" * 60)
+    print("📊 ÖRNEK 9: ARALIK TARAMASI")
+    print("=" * 60)
+    
+    start, stop = 1, 100000
+    result = collatz_sweep(start, stop, workers=1)
+    steps = result['stopping_times']
+    peaks = result['max_excursions']
+    
+    longest = max(range(len(steps)), key=steps.__getitem__)
+    highest = max(range(len(peaks)), key=peaks.__getitem__)
+    
+    print(f"\n   Aralık: [{start}, {stop})")
+    print(f"   En uzun yörünge: {start + longest} ({steps[longest]} adım)")
+    print(f"   En yüksek tepe: {start + highest} → {peaks[highest]}")
+    prefix = format(result['prefixes'][27 - start], '016b')[::-1]
+    print(f"   27'nin parite öneki (16 bit): {prefix}")
+
+
 def example_key_generation():
     """Anahtar üretimi örnekleri."""
     print("\n" + "=" * 60)
@@ -233,6 +264,7 @@ def main():
     example_encryption()
     example_different_seeds()
     example_key_generation()
+    example_sweep()
     
     print("\n\n" + "=" * 60)
     print("✅ Tüm örnekler başarıyla çalıştırıldı!")